@@ -6,6 +6,7 @@ information about a specific Terraform/OpenTofu module from registry APIs.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import cast
 
 from attrs import define
@@ -71,6 +72,18 @@ class ModuleInfoState:
     owner: str | None = None
 
 
+# (check, message) pairs evaluated in order by ModuleInfoDataSource._validate_config_sync; built once at import.
+_VALIDATORS: tuple[tuple[Callable[[ModuleInfoConfig], bool], str], ...] = (
+    (lambda c: not c.namespace, "'namespace' is required and cannot be empty."),
+    (lambda c: not c.name, "'name' is required and cannot be empty."),
+    (lambda c: not c.target_provider, "'target_provider' is required and cannot be empty."),
+    (
+        lambda c: bool(c.registry) and c.registry not in ("terraform", "opentofu"),
+        "'registry' must be either 'terraform' or 'opentofu'.",
+    ),
+)
+
+
 @register_data_source("tofusoup_module_info")
 class ModuleInfoDataSource(BaseDataSource[str, ModuleInfoState, ModuleInfoConfig]):  # type: ignore[misc]
     """Data source for querying module information from Terraform or OpenTofu registry.
@@ -128,16 +141,11 @@ class ModuleInfoDataSource(BaseDataSource[str, ModuleInfoState, ModuleInfoConfig
 
     async def _validate_config(self, config: ModuleInfoConfig) -> list[str]:
         """Validate the configuration. Returns list of error strings, or empty list if valid."""
-        errors = []
-        if not config.namespace:
-            errors.append("'namespace' is required and cannot be empty.")
-        if not config.name:
-            errors.append("'name' is required and cannot be empty.")
-        if not config.target_provider:
-            errors.append("'target_provider' is required and cannot be empty.")
-        if config.registry and config.registry not in ["terraform", "opentofu"]:
-            errors.append("'registry' must be either 'terraform' or 'opentofu'.")
-        return errors
+        return self._validate_config_sync(config)
+
+    def _validate_config_sync(self, config: ModuleInfoConfig) -> list[str]:
+        """Apply ``_VALIDATORS`` in order; namespace, name and target_provider are required."""
+        return [message for check, message in _VALIDATORS if check(config)]
 
     @classmethod
     def get_schema(cls) -> PvsSchema:
@@ -1,5 +1,6 @@
 """TofuSoup module_versions data source implementation."""
 
+from functools import cache
 from typing import Any, cast
 
 from attrs import define
@@ -18,7 +19,7 @@ from tofusoup.registry.opentofu import OpenTofuRegistry  # type: ignore
 from tofusoup.registry.terraform import IBMTerraformRegistry  # type: ignore
 
 
-@define(frozen=True)
+@define(frozen=True, weakref_slot=False)
 class ModuleVersionsConfig:
     """Configuration attributes for module_versions data source."""
 
@@ -28,7 +29,7 @@ class ModuleVersionsConfig:
     registry: str | None = "terraform"
 
 
-@define(frozen=True)
+@define(frozen=True, weakref_slot=False)
 class ModuleVersionsState:
     """State attributes for module_versions data source."""
 
@@ -40,6 +41,33 @@ class ModuleVersionsState:
     version_count: int | None = None
 
 
+@cache
+def _build_schema() -> PvsSchema:
+    """Build the module_versions schema, memoised for the life of the process."""
+    return s_data_source(
+        attributes={
+            "namespace": a_str(required=True),
+            "name": a_str(required=True),
+            "target_provider": a_str(required=True),
+            "registry": a_str(optional=True, default="terraform"),
+            "version_count": a_num(computed=True),
+            "versions": a_list(
+                element_type_def=a_obj(
+                    attributes={
+                        "version": a_str(computed=True),
+                        "published_at": a_str(computed=True),
+                        "readme_content": a_str(computed=True),
+                        "inputs": a_list(element_type_def=a_obj(attributes={}), computed=True),
+                        "outputs": a_list(element_type_def=a_obj(attributes={}), computed=True),
+                        "resources": a_list(element_type_def=a_obj(attributes={}), computed=True),
+                    }
+                ),
+                computed=True,
+            ),
+        }
+    )
+
+
 @register_data_source("tofusoup_module_versions")
 class ModuleVersionsDataSource(BaseDataSource[str, ModuleVersionsState, ModuleVersionsConfig]):  # type: ignore[misc]
     """
@@ -125,32 +153,15 @@ class ModuleVersionsDataSource(BaseDataSource[str, ModuleVersionsState, ModuleVe
     @classmethod
     def get_schema(cls) -> PvsSchema:
         """Return the data source schema."""
-        return s_data_source(
-            attributes={
-                "namespace": a_str(required=True),
-                "name": a_str(required=True),
-                "target_provider": a_str(required=True),
-                "registry": a_str(optional=True, default="terraform"),
-                "version_count": a_num(computed=True),
-                "versions": a_list(
-                    element_type_def=a_obj(
-                        attributes={
-                            "version": a_str(computed=True),
-                            "published_at": a_str(computed=True),
-                            "readme_content": a_str(computed=True),
-                            "inputs": a_list(element_type_def=a_obj(attributes={}), computed=True),
-                            "outputs": a_list(element_type_def=a_obj(attributes={}), computed=True),
-                            "resources": a_list(element_type_def=a_obj(attributes={}), computed=True),
-                        }
-                    ),
-                    computed=True,
-                ),
-            }
-        )
+        return _build_schema()
 
     @resilient()
     async def _validate_config(self, config: ModuleVersionsConfig) -> list[str]:
         """Validate the configuration. Returns list of error strings, or empty list if valid."""
+        return self._validate_config_sync(config)
+
+    def _validate_config_sync(self, config: ModuleVersionsConfig) -> list[str]:
+        """Require namespace, name and target_provider, and reject unknown registry names."""
         errors = []
         if not config.namespace:
             errors.append("'namespace' is required and cannot be empty.")
@@ -164,13 +175,14 @@ class ModuleVersionsDataSource(BaseDataSource[str, ModuleVersionsState, ModuleVe
 
     def _convert_version_to_dict(self, version: ModuleVersion) -> dict[str, Any]:
         """Convert a ModuleVersion object to a dictionary for state."""
+        published_at = version.published_at
         return {
             "version": version.version,
-            "published_at": version.published_at.isoformat() if version.published_at else None,
+            "published_at": published_at.isoformat() if published_at else None,
             "readme_content": version.readme_content,
-            "inputs": [vars(inp) for inp in (version.inputs or [])],
-            "outputs": [vars(out) for out in (version.outputs or [])],
-            "resources": [vars(res) for res in (version.resources or [])],
+            "inputs": [vars(inp) for inp in version.inputs or ()],
+            "outputs": [vars(out) for out in version.outputs or ()],
+            "resources": [vars(res) for res in version.resources or ()],
         }
 
     @resilient()
@@ -1,5 +1,6 @@
 """TofuSoup provider_info data source implementation."""
 
+from functools import cache
 from typing import cast
 
 from attrs import define
@@ -40,6 +41,23 @@ class ProviderInfoState:
     published_at: str | None = None
 
 
+@cache
+def _build_schema() -> PvsSchema:
+    """Build the provider_info schema once; every ``get_schema`` call returns this instance."""
+    return s_data_source(
+        attributes={
+            "namespace": a_str(required=True),
+            "name": a_str(required=True),
+            "registry": a_str(optional=True, default="terraform"),
+            "latest_version": a_str(computed=True),
+            "description": a_str(computed=True),
+            "source_url": a_str(computed=True),
+            "downloads": a_num(computed=True),
+            "published_at": a_str(computed=True),
+        }
+    )
+
+
 @register_data_source("tofusoup_provider_info")
 class ProviderInfoDataSource(BaseDataSource[str, ProviderInfoState, ProviderInfoConfig]):  # type: ignore[misc]
     """
@@ -104,22 +122,15 @@ class ProviderInfoDataSource(BaseDataSource[str, ProviderInfoState, ProviderInfo
     @classmethod
     def get_schema(cls) -> PvsSchema:
         """Return the data source schema."""
-        return s_data_source(
-            attributes={
-                "namespace": a_str(required=True),
-                "name": a_str(required=True),
-                "registry": a_str(optional=True, default="terraform"),
-                "latest_version": a_str(computed=True),
-                "description": a_str(computed=True),
-                "source_url": a_str(computed=True),
-                "downloads": a_num(computed=True),
-                "published_at": a_str(computed=True),
-            }
-        )
+        return _build_schema()
 
     @resilient()
     async def _validate_config(self, config: ProviderInfoConfig) -> list[str]:
         """Validate the configuration. Returns list of error strings, or empty list if valid."""
+        return self._validate_config_sync(config)
+
+    def _validate_config_sync(self, config: ProviderInfoConfig) -> list[str]:
+        """Require namespace and name, and reject registries other than terraform and opentofu."""
         errors = []
         if not config.namespace:
             errors.append("'namespace' is required and cannot be empty.")
@@ -1,5 +1,10 @@
 """TofuSoup provider_versions data source implementation."""
 
+import asyncio
+import sys
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from functools import cache
 from typing import Any, cast
 
 from attrs import define
@@ -12,13 +17,13 @@ from pyvider.resources.context import ResourceContext  # type: ignore
 from pyvider.schema import PvsSchema, a_list, a_num, a_obj, a_str, s_data_source  # type: ignore
 
 from tofusoup.config.defaults import OPENTOFU_REGISTRY_URL, TERRAFORM_REGISTRY_URL  # type: ignore
-from tofusoup.registry.base import RegistryConfig  # type: ignore
+from tofusoup.registry.base import BaseTfRegistry, RegistryConfig  # type: ignore
 from tofusoup.registry.models.provider import ProviderVersion  # type: ignore
 from tofusoup.registry.opentofu import OpenTofuRegistry  # type: ignore
 from tofusoup.registry.terraform import IBMTerraformRegistry  # type: ignore
 
 
-@define(frozen=True)
+@define(frozen=True, weakref_slot=False, cache_hash=True)
 class ProviderVersionsConfig:
     """Configuration attributes for provider_versions data source."""
 
@@ -27,7 +32,7 @@ class ProviderVersionsConfig:
     registry: str | None = "terraform"
 
 
-@define(frozen=True)
+@define(frozen=True, weakref_slot=False)
 class ProviderVersionsState:
     """State attributes for provider_versions data source."""
 
@@ -38,6 +43,82 @@ class ProviderVersionsState:
     version_count: int | None = None
 
 
+_REGISTRIES: frozenset[str] = frozenset({"terraform", "opentofu"})
+
+_VALIDATORS: tuple[tuple[Callable[[ProviderVersionsConfig], bool], str], ...] = (
+    (lambda c: not c.namespace, "'namespace' is required and cannot be empty."),
+    (lambda c: not c.name, "'name' is required and cannot be empty."),
+    (
+        lambda c: bool(c.registry) and c.registry not in _REGISTRIES,
+        "'registry' must be either 'terraform' or 'opentofu'.",
+    ),
+)
+
+# Responses with more versions than this are converted in a worker thread, so one very large provider does not
+# stall other reads sharing the event loop.
+_THREAD_CONVERT_THRESHOLD = 500
+
+
+def _platform_dict(os: str, arch: str) -> dict[str, str]:
+    """Build a platform's state entry, interning its strings.
+
+    Registries publish builds for a small, fixed set of platforms, so interning lets every entry share the same
+    few ``os``/``arch`` string objects. Each entry is a new dict owned by the state it is placed in.
+    """
+    return {"os": sys.intern(os), "arch": sys.intern(arch)}
+
+
+# Client constructors per registry name. The lambdas look the client classes up at call time, so patching
+# the module-level class names still takes effect.
+_REGISTRY_FACTORIES: dict[str, Callable[[], BaseTfRegistry]] = {
+    "terraform": lambda: IBMTerraformRegistry(RegistryConfig(base_url=TERRAFORM_REGISTRY_URL)),
+    "opentofu": lambda: OpenTofuRegistry(RegistryConfig(base_url=OPENTOFU_REGISTRY_URL)),
+}
+
+
+def _registry_name(registry: str | None) -> str:
+    """Normalise a configured registry to its key in ``_REGISTRY_FACTORIES``."""
+    return "opentofu" if registry == "opentofu" else "terraform"
+
+
+@asynccontextmanager
+async def get_registry(registry: str | None) -> AsyncIterator[BaseTfRegistry]:
+    """Open a client for ``registry`` for the duration of one read, closing it on exit."""
+    async with _REGISTRY_FACTORIES[_registry_name(registry)]() as client:
+        yield client
+
+
+@cache
+def _build_schema() -> PvsSchema:
+    """The provider_versions schema, cached because ``PvsSchema`` is immutable."""
+    return s_data_source(
+        attributes={
+            "namespace": a_str(required=True),
+            "name": a_str(required=True),
+            "registry": a_str(optional=True, default="terraform"),
+            "version_count": a_num(computed=True),
+            "versions": a_list(
+                element_type_def=a_obj(
+                    attributes={
+                        "version": a_str(computed=True),
+                        "protocols": a_list(element_type_def=a_str(), computed=True),
+                        "platforms": a_list(
+                            element_type_def=a_obj(
+                                attributes={
+                                    "os": a_str(computed=True),
+                                    "arch": a_str(computed=True),
+                                }
+                            ),
+                            computed=True,
+                        ),
+                    }
+                ),
+                computed=True,
+            ),
+        }
+    )
+
+
 @register_data_source("tofusoup_provider_versions")
 class ProviderVersionsDataSource(BaseDataSource[str, ProviderVersionsState, ProviderVersionsConfig]):  # type: ignore[misc]
     """
@@ -113,55 +194,29 @@ class ProviderVersionsDataSource(BaseDataSource[str, ProviderVersionsState, Prov
     @classmethod
     def get_schema(cls) -> PvsSchema:
         """Return the data source schema."""
-        return s_data_source(
-            attributes={
-                "namespace": a_str(required=True),
-                "name": a_str(required=True),
-                "registry": a_str(optional=True, default="terraform"),
-                "version_count": a_num(computed=True),
-                "versions": a_list(
-                    element_type_def=a_obj(
-                        attributes={
-                            "version": a_str(computed=True),
-                            "protocols": a_list(element_type_def=a_str(), computed=True),
-                            "platforms": a_list(
-                                element_type_def=a_obj(
-                                    attributes={
-                                        "os": a_str(computed=True),
-                                        "arch": a_str(computed=True),
-                                    }
-                                ),
-                                computed=True,
-                            ),
-                        }
-                    ),
-                    computed=True,
-                ),
-            }
-        )
+        return _build_schema()
 
     @resilient()
     async def _validate_config(self, config: ProviderVersionsConfig) -> list[str]:
         """Validate the configuration. Returns list of error strings, or empty list if valid."""
-        errors = []
-        if not config.namespace:
-            errors.append("'namespace' is required and cannot be empty.")
-        if not config.name:
-            errors.append("'name' is required and cannot be empty.")
-        if config.registry and config.registry not in ["terraform", "opentofu"]:
-            errors.append("'registry' must be either 'terraform' or 'opentofu'.")
-        return errors
+        return self._validate_config_sync(config)
+
+    def _validate_config_sync(self, config: ProviderVersionsConfig) -> list[str]:
+        """Collect the message of every ``_VALIDATORS`` rule that ``config`` breaks, in rule order."""
+        return [message for check, message in _VALIDATORS if check(config)]
 
     def _convert_version_to_dict(self, version: ProviderVersion) -> dict[str, Any]:
-        """Convert a ProviderVersion object to a dictionary for state."""
+        """Convert a ProviderVersion object to a dictionary for state, with a fresh platform dict per entry."""
         return {
             "version": version.version,
-            "protocols": list(version.protocols) if version.protocols else [],
-            "platforms": [
-                {"os": platform.os, "arch": platform.arch} for platform in (version.platforms or [])
-            ],
+            "protocols": list(version.protocols or ()),
+            "platforms": [_platform_dict(p.os, p.arch) for p in version.platforms or ()],
         }
 
+    def _convert_versions(self, versions: list[ProviderVersion]) -> list[dict[str, Any]]:
+        """Convert registry versions to state dicts."""
+        return list(map(self._convert_version_to_dict, versions))
+
     @resilient()
     async def read(self, ctx: ResourceContext) -> ProviderVersionsState:
         """Read provider versions from the registry."""
@@ -179,18 +234,13 @@ class ProviderVersionsDataSource(BaseDataSource[str, ProviderVersionsState, Prov
         )
 
         try:
-            # Select the appropriate registry
-            if config.registry == "opentofu":
-                registry_config = RegistryConfig(base_url=OPENTOFU_REGISTRY_URL)
-                async with OpenTofuRegistry(registry_config) as registry:
-                    versions = await registry.list_provider_versions(provider_id)
-            else:
-                registry_config = RegistryConfig(base_url=TERRAFORM_REGISTRY_URL)
-                async with IBMTerraformRegistry(registry_config) as registry:
-                    versions = await registry.list_provider_versions(provider_id)
+            async with get_registry(config.registry) as registry:
+                versions = await registry.list_provider_versions(provider_id)
 
-            # Convert ProviderVersion objects to dicts
-            versions_data = [self._convert_version_to_dict(v) for v in versions]
+            if len(versions) > _THREAD_CONVERT_THRESHOLD:
+                versions_data = await asyncio.to_thread(self._convert_versions, versions)
+            else:
+                versions_data = self._convert_versions(versions)
 
             logger.info(
                 "Retrieved provider versions",
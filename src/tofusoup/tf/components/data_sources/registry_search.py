@@ -1,6 +1,9 @@
 """TofuSoup registry_search data source implementation."""
 
-from typing import Any, cast
+from collections.abc import Iterable
+from functools import cache
+from itertools import islice
+from typing import Any, TypeVar, cast
 
 from attrs import define
 from provide.foundation import logger
@@ -12,14 +15,27 @@ from pyvider.resources.context import ResourceContext  # type: ignore
 from pyvider.schema import PvsSchema, a_bool, a_list, a_num, a_obj, a_str, s_data_source  # type: ignore
 
 from tofusoup.config.defaults import OPENTOFU_REGISTRY_URL, TERRAFORM_REGISTRY_URL  # type: ignore
-from tofusoup.registry.base import RegistryConfig  # type: ignore
+from tofusoup.registry.base import BaseTfRegistry, RegistryConfig  # type: ignore
 from tofusoup.registry.models.module import Module  # type: ignore
 from tofusoup.registry.models.provider import Provider  # type: ignore
 from tofusoup.registry.opentofu import OpenTofuRegistry  # type: ignore
 from tofusoup.registry.terraform import IBMTerraformRegistry  # type: ignore
 
+_Result = TypeVar("_Result", Provider, Module)
 
-@define(frozen=True)
+
+def _unique_by_id(results: Iterable[_Result]) -> list[_Result]:
+    """Drop repeated results, keeping the first occurrence of each ``id`` in registry order."""
+    seen: set[str] = set()
+    unique = []
+    for result in results:
+        if result.id not in seen:
+            seen.add(result.id)
+            unique.append(result)
+    return unique
+
+
+@define(frozen=True, weakref_slot=False, cache_hash=True)
 class RegistrySearchConfig:
     """Configuration attributes for registry_search data source."""
 
@@ -29,7 +45,7 @@ class RegistrySearchConfig:
     resource_type: str | None = "all"
 
 
-@define(frozen=True)
+@define(frozen=True, weakref_slot=False)
 class RegistrySearchState:
     """State attributes for registry_search data source."""
 
@@ -43,6 +59,39 @@ class RegistrySearchState:
     results: list[dict[str, Any]] | None = None
 
 
+@cache
+def _build_schema() -> PvsSchema:
+    """Schema for ``tofusoup_registry_search``, built on the first ``get_schema`` call."""
+    return s_data_source(
+        attributes={
+            "query": a_str(required=True),
+            "registry": a_str(optional=True, default="terraform"),
+            "limit": a_num(optional=True, default=50),
+            "resource_type": a_str(optional=True, default="all"),
+            "result_count": a_num(computed=True),
+            "provider_count": a_num(computed=True),
+            "module_count": a_num(computed=True),
+            "results": a_list(
+                element_type_def=a_obj(
+                    attributes={
+                        "type": a_str(computed=True),
+                        "id": a_str(computed=True),
+                        "namespace": a_str(computed=True),
+                        "name": a_str(computed=True),
+                        "provider_name": a_str(computed=True),
+                        "description": a_str(computed=True),
+                        "source_url": a_str(computed=True),
+                        "downloads": a_num(computed=True),
+                        "verified": a_bool(computed=True),
+                        "tier": a_str(computed=True),
+                    }
+                ),
+                computed=True,
+            ),
+        }
+    )
+
+
 @register_data_source("tofusoup_registry_search")
 class RegistrySearchDataSource(BaseDataSource[str, RegistrySearchState, RegistrySearchConfig]):  # type: ignore[misc]
     """
@@ -138,34 +187,7 @@ class RegistrySearchDataSource(BaseDataSource[str, RegistrySearchState, Registry
     @classmethod
     def get_schema(cls) -> PvsSchema:
         """Return the data source schema."""
-        return s_data_source(
-            attributes={
-                "query": a_str(required=True),
-                "registry": a_str(optional=True, default="terraform"),
-                "limit": a_num(optional=True, default=50),
-                "resource_type": a_str(optional=True, default="all"),
-                "result_count": a_num(computed=True),
-                "provider_count": a_num(computed=True),
-                "module_count": a_num(computed=True),
-                "results": a_list(
-                    element_type_def=a_obj(
-                        attributes={
-                            "type": a_str(computed=True),
-                            "id": a_str(computed=True),
-                            "namespace": a_str(computed=True),
-                            "name": a_str(computed=True),
-                            "provider_name": a_str(computed=True),
-                            "description": a_str(computed=True),
-                            "source_url": a_str(computed=True),
-                            "downloads": a_num(computed=True),
-                            "verified": a_bool(computed=True),
-                            "tier": a_str(computed=True),
-                        }
-                    ),
-                    computed=True,
-                ),
-            }
-        )
+        return _build_schema()
 
     @resilient()
     async def _validate_config(self, config: RegistrySearchConfig) -> list[str]:
@@ -213,6 +235,21 @@ class RegistrySearchDataSource(BaseDataSource[str, RegistrySearchState, Registry
             "tier": None,  # N/A for modules
         }
 
+    async def _search(
+        self, registry: BaseTfRegistry, config: RegistrySearchConfig, limit: int | None
+    ) -> tuple[list[Provider], list[Module]]:
+        """Fetch de-duplicated providers and modules based on the resource_type filter.
+
+        The registry API takes no limit, so modules are skipped entirely once providers alone fill it.
+        """
+        providers: list[Provider] = []
+        modules: list[Module] = []
+        if config.resource_type in ["all", "providers"]:
+            providers = _unique_by_id(await registry.list_providers(query=config.query))
+        if config.resource_type in ["all", "modules"] and (limit is None or len(providers) < limit):
+            modules = _unique_by_id(await registry.list_modules(query=config.query))
+        return providers, modules
+
     @resilient()
     async def read(self, ctx: ResourceContext) -> RegistrySearchState:
         """Search for providers and/or modules in the registry."""
@@ -230,41 +267,28 @@ class RegistrySearchDataSource(BaseDataSource[str, RegistrySearchState, Registry
         )
 
         try:
-            providers: list[Provider] = []
-            modules: list[Module] = []
+            # Convert to int since the schema number may be a float
+            limit = max(int(config.limit), 0) if config.limit is not None else None
 
             # Select the appropriate registry
             if config.registry == "opentofu":
                 registry_config = RegistryConfig(base_url=OPENTOFU_REGISTRY_URL)
                 async with OpenTofuRegistry(registry_config) as registry:
-                    # Fetch providers and modules based on resource_type filter
-                    if config.resource_type in ["all", "providers"]:
-                        providers = await registry.list_providers(query=config.query)
-                    if config.resource_type in ["all", "modules"]:
-                        modules = await registry.list_modules(query=config.query)
+                    providers, modules = await self._search(registry, config, limit)
             else:
                 registry_config = RegistryConfig(base_url=TERRAFORM_REGISTRY_URL)
                 async with IBMTerraformRegistry(registry_config) as registry:
-                    # Fetch providers and modules based on resource_type filter
-                    if config.resource_type in ["all", "providers"]:
-                        providers = await registry.list_providers(query=config.query)
-                    if config.resource_type in ["all", "modules"]:
-                        modules = await registry.list_modules(query=config.query)
-
-            # Convert to dictionaries
-            provider_dicts = [self._convert_provider_to_dict(p) for p in providers]
-            module_dicts = [self._convert_module_to_dict(m) for m in modules]
+                    providers, modules = await self._search(registry, config, limit)
 
-            # Merge results (providers first, then modules)
+            # Merge results (providers first, then modules), applying the limit before conversion so results
+            # past it are never turned into dicts
+            provider_dicts = [self._convert_provider_to_dict(p) for p in islice(providers, limit)]
+            remaining = None if limit is None else limit - len(provider_dicts)
+            module_dicts = [self._convert_module_to_dict(m) for m in islice(modules, remaining)]
             all_results = provider_dicts + module_dicts
 
-            # Apply limit if specified (convert to int to avoid slice error)
-            if config.limit is not None:
-                all_results = all_results[: int(config.limit)]
-
-            # Count provider vs module results in final list
-            final_provider_count = sum(1 for r in all_results if r["type"] == "provider")
-            final_module_count = sum(1 for r in all_results if r["type"] == "module")
+            final_provider_count = len(provider_dicts)
+            final_module_count = len(module_dicts)
 
             logger.info(
                 "Retrieved registry search results",
@@ -5,49 +5,236 @@
 
 """Shared test fixtures for data source tests."""
 
+import json
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from datetime import datetime
+from types import MappingProxyType, ModuleType
 from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from pyvider.resources.context import ResourceContext  # type: ignore
+from tofusoup.registry.base import BaseTfRegistry  # type: ignore
 from tofusoup.registry.models.module import Module, ModuleVersion  # type: ignore
 from tofusoup.registry.models.provider import Provider, ProviderPlatform, ProviderVersion  # type: ignore
 
-from tofusoup.tf.components.data_sources.provider_info import ProviderInfoConfig  # type: ignore
+from tofusoup.tf.components.data_sources.module_info import ModuleInfoDataSource  # type: ignore
+from tofusoup.tf.components.data_sources.module_search import ModuleSearchDataSource  # type: ignore
+from tofusoup.tf.components.data_sources.module_versions import ModuleVersionsDataSource  # type: ignore
+from tofusoup.tf.components.data_sources.provider_info import ProviderInfoConfig, ProviderInfoDataSource  # type: ignore
+from tofusoup.tf.components.data_sources.provider_versions import ProviderVersionsDataSource  # type: ignore
+from tofusoup.tf.components.data_sources.registry_search import RegistrySearchDataSource  # type: ignore
+from tofusoup.tf.components.data_sources.state_info import StateInfoDataSource  # type: ignore
+
+
+class AsyncContextStub:
+    """Minimal async context manager standing in for a registry client's ``async with`` block."""
+
+    def __init__(self, inner: Any) -> None:
+        self._inner = inner
+
+    async def __aenter__(self) -> Any:
+        return self._inner
+
+    async def __aexit__(self, *exc_info: object) -> bool:
+        # An explicit False keeps registry errors propagating out of the ``async with`` block; a bare
+        # ``AsyncMock()`` here would return a truthy MagicMock and silently swallow them.
+        return False
+
+
+@pytest.fixture(scope="session")
+def async_cm() -> type[AsyncContextStub]:
+    """Wrap a registry double so patched registry classes can be entered without ``AsyncMock`` plumbing."""
+    return AsyncContextStub
+
+
+class FakeRegistry:
+    """Registry client stand-in for reads whose registry calls are never asserted on.
+
+    Every ``list_*`` query answers with a copy of ``results``, or raises ``error`` when one is given. Like the real
+    clients, it is its own async context manager.
+    """
+
+    __slots__ = ("_error", "_results")
+
+    def __init__(self, results: Sequence[Any] = (), error: Exception | None = None) -> None:
+        self._results = results
+        self._error = error
+
+    async def __aenter__(self) -> "FakeRegistry":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> bool:
+        return False
+
+    def _answer(self) -> list[Any]:
+        if self._error is not None:
+            raise self._error
+        return list(self._results)
+
+    async def list_providers(self, query: str) -> list[Any]:
+        return self._answer()
+
+    async def list_modules(self, query: str) -> list[Any]:
+        return self._answer()
+
+    async def list_provider_versions(self, provider_id: str) -> list[Any]:
+        return self._answer()
+
+    async def list_module_versions(self, module_id: str) -> list[Any]:
+        return self._answer()
+
+
+@pytest.fixture(scope="session")
+def fake_registry_class() -> type[FakeRegistry]:
+    """The shared ``FakeRegistry`` class; cheaper than an ``AsyncMock`` when no call is asserted on."""
+    return FakeRegistry
+
+
+_REGISTRY_CLASSES = {"terraform": "IBMTerraformRegistry", "opentofu": "OpenTofuRegistry"}
+
+
+@pytest.fixture(scope="session")
+def mock_registry_factory() -> Callable[..., MagicMock]:
+    """Factory for a registry client mock with one ``AsyncMock`` per named method.
+
+    The mock is specced on ``BaseTfRegistry``, so a typo'd registry method fails loudly instead of returning an
+    auto-created child, and entering it with ``async with`` yields the mock itself, as real clients do.
+
+    Usage: ``mock_registry_factory(list_modules={"return_value": results})``
+    """
+
+    def _make(**methods: dict[str, Any]) -> MagicMock:
+        registry = MagicMock(spec=BaseTfRegistry)
+        registry.__aenter__.return_value = registry
+        for name, mock_kwargs in methods.items():
+            setattr(registry, name, AsyncMock(**mock_kwargs))
+        return registry
+
+    return _make
 
 
 @pytest.fixture
-def sample_config() -> ProviderInfoConfig:
-    """Sample valid provider info config."""
-    return ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform")
+def registry_classes(monkeypatch: pytest.MonkeyPatch, registry_module: ModuleType) -> dict[str, MagicMock]:
+    """Replace both registry client classes in ``registry_module`` with MagicMocks, keyed by registry name.
+
+    Test packages that read through a registry define ``registry_module`` as the data source module under test.
+    """
+    classes = {which: MagicMock() for which in _REGISTRY_CLASSES}
+    for which, class_name in _REGISTRY_CLASSES.items():
+        monkeypatch.setattr(registry_module, class_name, classes[which])
+    return classes
 
 
 @pytest.fixture
-def sample_terraform_response() -> dict[str, Any]:
-    """Sample Terraform registry API response."""
-    return {
-        "namespace": "hashicorp",
-        "name": "aws",
-        "version": "5.31.0",
-        "description": "Terraform AWS provider",
-        "source": "https://github.com/hashicorp/terraform-provider-aws",
-        "downloads": 1000000,
-        "published_at": "2024-01-15T10:30:00Z",
-    }
+def use_registry(registry_classes: dict[str, MagicMock]) -> Callable[..., None]:
+    """Make the ``which`` registry client class return ``registry`` for one test.
+
+    Usage: ``use_registry(mock_registry_factory(...), which="opentofu")`` or ``use_registry(fake_registry_class(results))``
+    """
+
+    def _use(registry: Any, which: str = "terraform") -> None:
+        registry_classes[which].return_value = registry
+
+    return _use
+
+
+@pytest.fixture(scope="session")
+def async_return() -> Callable[[Any], Callable[..., Awaitable[Any]]]:
+    """Factory for a bare coroutine function returning a fixed value.
+
+    Cheaper than ``AsyncMock(return_value=...)`` for registry methods whose calls are never asserted on.
+    """
+
+    def _make(value: Any) -> Callable[..., Awaitable[Any]]:
+        async def _return(*args: Any, **kwargs: Any) -> Any:
+            return value
+
+        return _return
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def async_raise() -> Callable[[BaseException], Callable[..., Awaitable[Any]]]:
+    """Factory for a bare coroutine function raising a fixed exception.
+
+    Cheaper than ``AsyncMock(side_effect=...)`` for registry methods whose calls are never asserted on.
+    """
+
+    def _make(exc: BaseException) -> Callable[..., Awaitable[Any]]:
+        async def _raise(*args: Any, **kwargs: Any) -> Any:
+            raise exc
+
+        return _raise
+
+    return _make
 
 
 @pytest.fixture
-def sample_opentofu_response() -> dict[str, Any]:
-    """Sample OpenTofu registry API response."""
-    return {
-        "namespace": "hashicorp",
-        "name": "random",
-        "version": "3.6.0",
-        "description": "OpenTofu Random provider",
-        "source": "https://github.com/opentofu/terraform-provider-random",
-        "downloads": 500000,
-        "published_at": "2024-01-10T08:00:00Z",
-    }
+def make_ctx() -> Callable[[Any], ResourceContext]:
+    """Factory for ``ResourceContext`` objects, reusing one context per config within a test.
+
+    Contexts carry a mutable diagnostics list, so the cache is deliberately function-scoped.
+    """
+    contexts: dict[Any, ResourceContext] = {}
+
+    def _make(config: Any) -> ResourceContext:
+        if config not in contexts:
+            contexts[config] = ResourceContext(config=config, state=None)
+        return contexts[config]
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def sample_config() -> ProviderInfoConfig:
+    """Sample valid provider info config; frozen, so one instance is shared for the session."""
+    return ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform")
+
+
+@pytest.fixture(scope="session")
+def sample_terraform_response() -> Mapping[str, Any]:
+    """Sample Terraform registry API response; read-only, so one mapping is shared for the session."""
+    return MappingProxyType(
+        {
+            "namespace": "hashicorp",
+            "name": "aws",
+            "version": "5.31.0",
+            "description": "Terraform AWS provider",
+            "source": "https://github.com/hashicorp/terraform-provider-aws",
+            "downloads": 1000000,
+            "published_at": "2024-01-15T10:30:00Z",
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_terraform_response_body(sample_terraform_response: Mapping[str, Any]) -> bytes:
+    """``sample_terraform_response`` serialized once, for mocks that serve raw JSON content."""
+    return json.dumps(dict(sample_terraform_response)).encode()
+
+
+@pytest.fixture(scope="session")
+def sample_opentofu_response() -> Mapping[str, Any]:
+    """Sample OpenTofu registry API response; read-only, so one mapping is shared for the session."""
+    return MappingProxyType(
+        {
+            "namespace": "hashicorp",
+            "name": "random",
+            "version": "3.6.0",
+            "description": "OpenTofu Random provider",
+            "source": "https://github.com/opentofu/terraform-provider-random",
+            "downloads": 500000,
+            "published_at": "2024-01-10T08:00:00Z",
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_opentofu_response_body(sample_opentofu_response: Mapping[str, Any]) -> bytes:
+    """``sample_opentofu_response`` serialized once, for mocks that serve raw JSON content."""
+    return json.dumps(dict(sample_opentofu_response)).encode()
 
 
 @pytest.fixture
@@ -102,10 +289,10 @@ def sample_module_response() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
-def sample_module_versions() -> list[ModuleVersion]:
-    """Sample module versions list."""
-    return [
+@pytest.fixture(scope="session")
+def sample_module_versions() -> tuple[ModuleVersion, ...]:
+    """Sample module versions, built once per session; tests must treat them as read-only."""
+    return (
         ModuleVersion(
             version="6.5.0",
             published_at=datetime.fromisoformat("2025-10-21T21:09:25.665344"),
@@ -130,13 +317,13 @@ def sample_module_versions() -> list[ModuleVersion]:
             outputs=[],
             resources=[],
         ),
-    ]
+    )
 
 
-@pytest.fixture
-def sample_module_search_results() -> list[Module]:
-    """Sample module search results list."""
-    return [
+@pytest.fixture(scope="session")
+def sample_module_search_results() -> tuple[Module, ...]:
+    """Sample module search results, built once per session; tests must treat them as read-only."""
+    return (
         Module(
             id="terraform-aws-modules/vpc/aws",
             namespace="terraform-aws-modules",
@@ -176,13 +363,13 @@ def sample_module_search_results() -> list[Module]:
             latest_version=None,
             registry_source=None,
         ),
-    ]
+    )
 
 
-@pytest.fixture
-def sample_provider_search_results() -> list[Provider]:
-    """Sample provider search results list."""
-    return [
+@pytest.fixture(scope="session")
+def sample_provider_search_results() -> tuple[Provider, ...]:
+    """Sample provider search results, built once per session; tests must treat them as read-only."""
+    return (
         Provider(
             id="hashicorp/aws",
             namespace="hashicorp",
@@ -205,7 +392,29 @@ def sample_provider_search_results() -> list[Provider]:
             latest_version=None,
             registry_source=None,
         ),
-    ]
+    )
+
+
+def _data_source_fixture(name: str, data_source_class: type[Any]) -> Any:
+    """Build the module-scoped ``name`` fixture, yielding one ``data_source_class`` instance per test module.
+
+    Data sources hold no per-read state, so every test in a module can read through the same instance.
+    """
+
+    def _data_source() -> Any:
+        return data_source_class()
+
+    _data_source.__doc__ = f"One ``{data_source_class.__name__}`` shared by the tests of a module."
+    return pytest.fixture(scope="module", name=name)(_data_source)
+
+
+module_info_ds = _data_source_fixture("module_info_ds", ModuleInfoDataSource)
+module_search_ds = _data_source_fixture("module_search_ds", ModuleSearchDataSource)
+module_versions_ds = _data_source_fixture("module_versions_ds", ModuleVersionsDataSource)
+provider_info_ds = _data_source_fixture("provider_info_ds", ProviderInfoDataSource)
+provider_versions_ds = _data_source_fixture("provider_versions_ds", ProviderVersionsDataSource)
+registry_search_ds = _data_source_fixture("registry_search_ds", RegistrySearchDataSource)
+state_info_ds = _data_source_fixture("state_info_ds", StateInfoDataSource)
 
 
 @pytest.fixture
@@ -10,12 +10,10 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from attrs.exceptions import FrozenInstanceError
-from pyvider.resources.context import ResourceContext  # type: ignore
 from tofusoup.registry.models.module import ModuleVersion  # type: ignore
 
 from tofusoup.tf.components.data_sources.module_info import (  # type: ignore
     ModuleInfoConfig,
-    ModuleInfoDataSource,
     ModuleInfoState,
 )
 
@@ -25,34 +23,32 @@ class TestModuleInfoEdgeCases:
 
     @pytest.mark.asyncio
     async def test_read_with_null_registry_defaults_to_terraform(
-        self, sample_module_response: dict[str, Any]
+        self, sample_module_response: dict[str, Any], async_return, make_ctx, async_cm, module_info_ds
     ) -> None:
         """Test that None/null registry value defaults to terraform."""
         # Explicitly set registry to None
         config = ModuleInfoConfig(
             namespace="terraform-aws-modules", name="vpc", target_provider="aws", registry=None
         )
-        ctx = ResourceContext(config=config, state=None)
+        ctx = make_ctx(config)
 
         mock_registry = AsyncMock()
         mock_versions = [ModuleVersion(version="6.5.0")]
-        mock_registry.list_module_versions = AsyncMock(return_value=mock_versions)
-        mock_registry.get_module_details = AsyncMock(return_value=sample_module_response)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        ds = ModuleInfoDataSource()
+        mock_registry.list_module_versions = async_return(mock_versions)
+        mock_registry.get_module_details = async_return(sample_module_response)
 
         with patch("tofusoup.tf.components.data_sources.module_info.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            result = await ds.read(ctx)
+            mock_class.return_value = async_cm(mock_registry)
+            result = await module_info_ds.read(ctx)
 
         # Should use terraform registry (the default)
         assert result.registry is None  # Echoes back the config value
         assert result.version == "6.5.0"  # But successfully fetched from terraform
 
     @pytest.mark.asyncio
-    async def test_read_response_with_extra_fields_ignored(self) -> None:
+    async def test_read_response_with_extra_fields_ignored(
+        self, async_return, make_ctx, async_cm, module_info_ds
+    ) -> None:
         """Test that extra fields in response are safely ignored."""
         response_with_extras: dict[str, Any] = {
             "namespace": "terraform-aws-modules",
@@ -74,20 +70,16 @@ class TestModuleInfoEdgeCases:
         config = ModuleInfoConfig(
             namespace="terraform-aws-modules", name="vpc", target_provider="aws", registry="terraform"
         )
-        ctx = ResourceContext(config=config, state=None)
+        ctx = make_ctx(config)
 
         mock_registry = AsyncMock()
         mock_versions = [ModuleVersion(version="6.5.0")]
-        mock_registry.list_module_versions = AsyncMock(return_value=mock_versions)
-        mock_registry.get_module_details = AsyncMock(return_value=response_with_extras)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        ds = ModuleInfoDataSource()
+        mock_registry.list_module_versions = async_return(mock_versions)
+        mock_registry.get_module_details = async_return(response_with_extras)
 
         with patch("tofusoup.tf.components.data_sources.module_info.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            result = await ds.read(ctx)
+            mock_class.return_value = async_cm(mock_registry)
+            result = await module_info_ds.read(ctx)
 
         # Should successfully extract known fields and ignore extras
         assert result.version == "6.5.0"
@@ -111,12 +103,14 @@ class TestModuleInfoEdgeCases:
             state.namespace = "new"
 
     @pytest.mark.asyncio
-    async def test_read_queries_latest_version(self, sample_module_response: dict[str, Any]) -> None:
+    async def test_read_queries_latest_version(
+        self, sample_module_response: dict[str, Any], make_ctx, async_cm, module_info_ds
+    ) -> None:
         """Test that read queries for latest version when multiple exist."""
         config = ModuleInfoConfig(
             namespace="terraform-aws-modules", name="vpc", target_provider="aws", registry="terraform"
         )
-        ctx = ResourceContext(config=config, state=None)
+        ctx = make_ctx(config)
 
         # Mock multiple versions, first should be the latest
         mock_versions = [
@@ -128,14 +122,10 @@ class TestModuleInfoEdgeCases:
         mock_registry = AsyncMock()
         mock_registry.list_module_versions = AsyncMock(return_value=mock_versions)
         mock_registry.get_module_details = AsyncMock(return_value=sample_module_response)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        ds = ModuleInfoDataSource()
 
         with patch("tofusoup.tf.components.data_sources.module_info.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            result = await ds.read(ctx)
+            mock_class.return_value = async_cm(mock_registry)
+            result = await module_info_ds.read(ctx)
 
         # Should use the first (latest) version
         mock_registry.get_module_details.assert_called_once_with(
@@ -9,12 +9,10 @@ from typing import Any
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from pyvider.resources.context import ResourceContext  # type: ignore
 from tofusoup.registry.models.module import ModuleVersion  # type: ignore
 
 from tofusoup.tf.components.data_sources.module_info import (  # type: ignore
     ModuleInfoConfig,
-    ModuleInfoDataSource,
 )
 
 
@@ -22,12 +20,14 @@ class TestModuleInfoRead:
     """Tests for read() method."""
 
     @pytest.mark.asyncio
-    async def test_read_terraform_registry_success(self, sample_module_response: dict[str, Any]) -> None:
+    async def test_read_terraform_registry_success(
+        self, sample_module_response: dict[str, Any], make_ctx, async_cm, module_info_ds
+    ) -> None:
         """Test successful read from Terraform registry."""
         config = ModuleInfoConfig(
             namespace="terraform-aws-modules", name="vpc", target_provider="aws", registry="terraform"
         )
-        ctx = ResourceContext(config=config, state=None)
+        ctx = make_ctx(config)
 
         # Mock the registry client
         mock_registry = AsyncMock()
@@ -36,14 +36,10 @@ class TestModuleInfoRead:
         mock_registry.list_module_versions = AsyncMock(return_value=mock_versions)
         # Mock get_module_details to return sample response
         mock_registry.get_module_details = AsyncMock(return_value=sample_module_response)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        ds = ModuleInfoDataSource()
 
         with patch("tofusoup.tf.components.data_sources.module_info.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            result = await ds.read(ctx)
+            mock_class.return_value = async_cm(mock_registry)
+            result = await module_info_ds.read(ctx)
 
         assert result.namespace == "terraform-aws-modules"
         assert result.name == "vpc"
@@ -58,7 +54,7 @@ class TestModuleInfoRead:
         assert result.owner == "antonbabenko"
 
     @pytest.mark.asyncio
-    async def test_read_opentofu_registry_success(self) -> None:
+    async def test_read_opentofu_registry_success(self, make_ctx, async_cm, module_info_ds) -> None:
         """Test successful read from OpenTofu registry."""
         opentofu_response = {
             "namespace": "aws-ia",
@@ -74,21 +70,17 @@ class TestModuleInfoRead:
         }
 
         config = ModuleInfoConfig(namespace="aws-ia", name="vpc", target_provider="aws", registry="opentofu")
-        ctx = ResourceContext(config=config, state=None)
+        ctx = make_ctx(config)
 
         # Mock the registry client
         mock_registry = AsyncMock()
         mock_versions = [ModuleVersion(version="4.2.0")]
         mock_registry.list_module_versions = AsyncMock(return_value=mock_versions)
         mock_registry.get_module_details = AsyncMock(return_value=opentofu_response)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        ds = ModuleInfoDataSource()
 
         with patch("tofusoup.tf.components.data_sources.module_info.OpenTofuRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            result = await ds.read(ctx)
+            mock_class.return_value = async_cm(mock_registry)
+            result = await module_info_ds.read(ctx)
 
         assert result.namespace == "aws-ia"
         assert result.name == "vpc"
@@ -98,48 +90,44 @@ class TestModuleInfoRead:
         assert result.verified is True
 
     @pytest.mark.asyncio
-    async def test_read_default_registry_uses_terraform(self, sample_module_response: dict[str, Any]) -> None:
+    async def test_read_default_registry_uses_terraform(
+        self, sample_module_response: dict[str, Any], make_ctx, async_cm, module_info_ds
+    ) -> None:
         """Test that default registry value uses Terraform registry."""
         # Not specifying registry, should default to "terraform"
         config = ModuleInfoConfig(namespace="terraform-aws-modules", name="vpc", target_provider="aws")
-        ctx = ResourceContext(config=config, state=None)
+        ctx = make_ctx(config)
 
         mock_registry = AsyncMock()
         mock_versions = [ModuleVersion(version="6.5.0")]
         mock_registry.list_module_versions = AsyncMock(return_value=mock_versions)
         mock_registry.get_module_details = AsyncMock(return_value=sample_module_response)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        ds = ModuleInfoDataSource()
 
         with patch("tofusoup.tf.components.data_sources.module_info.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            result = await ds.read(ctx)
+            mock_class.return_value = async_cm(mock_registry)
+            result = await module_info_ds.read(ctx)
 
         assert result.registry == "terraform"
         assert result.version == "6.5.0"
 
     @pytest.mark.asyncio
-    async def test_read_maps_all_response_fields(self, sample_module_response: dict[str, Any]) -> None:
+    async def test_read_maps_all_response_fields(
+        self, sample_module_response: dict[str, Any], make_ctx, async_cm, module_info_ds
+    ) -> None:
         """Test that all fields from registry response are mapped correctly."""
         config = ModuleInfoConfig(
             namespace="terraform-aws-modules", name="vpc", target_provider="aws", registry="terraform"
         )
-        ctx = ResourceContext(config=config, state=None)
+        ctx = make_ctx(config)
 
         mock_registry = AsyncMock()
         mock_versions = [ModuleVersion(version="6.5.0")]
         mock_registry.list_module_versions = AsyncMock(return_value=mock_versions)
         mock_registry.get_module_details = AsyncMock(return_value=sample_module_response)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        ds = ModuleInfoDataSource()
 
         with patch("tofusoup.tf.components.data_sources.module_info.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            result = await ds.read(ctx)
+            mock_class.return_value = async_cm(mock_registry)
+            result = await module_info_ds.read(ctx)
 
         # Verify all response fields are mapped
         assert result.version == sample_module_response["version"]
@@ -151,7 +139,7 @@ class TestModuleInfoRead:
         assert result.owner == sample_module_response["owner"]
 
     @pytest.mark.asyncio
-    async def test_read_handles_missing_optional_fields(self) -> None:
+    async def test_read_handles_missing_optional_fields(self, make_ctx, async_cm, module_info_ds) -> None:
         """Test that read handles missing optional fields gracefully."""
         # Response with minimal fields
         minimal_response: dict[str, Any] = {
@@ -164,20 +152,16 @@ class TestModuleInfoRead:
         config = ModuleInfoConfig(
             namespace="terraform-aws-modules", name="vpc", target_provider="aws", registry="terraform"
         )
-        ctx = ResourceContext(config=config, state=None)
+        ctx = make_ctx(config)
 
         mock_registry = AsyncMock()
         mock_versions = [ModuleVersion(version="6.5.0")]
         mock_registry.list_module_versions = AsyncMock(return_value=mock_versions)
         mock_registry.get_module_details = AsyncMock(return_value=minimal_response)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        ds = ModuleInfoDataSource()
 
         with patch("tofusoup.tf.components.data_sources.module_info.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            result = await ds.read(ctx)
+            mock_class.return_value = async_cm(mock_registry)
+            result = await module_info_ds.read(ctx)
 
         # Should not crash, optional fields should be None
         assert result.namespace == "terraform-aws-modules"
@@ -192,25 +176,23 @@ class TestModuleInfoRead:
         assert result.owner is None
 
     @pytest.mark.asyncio
-    async def test_read_preserves_config_values(self, sample_module_response: dict[str, Any]) -> None:
+    async def test_read_preserves_config_values(
+        self, sample_module_response: dict[str, Any], make_ctx, async_cm, module_info_ds
+    ) -> None:
         """Test that config values are preserved in the result state."""
         config = ModuleInfoConfig(
             namespace="terraform-aws-modules", name="vpc", target_provider="aws", registry="terraform"
         )
-        ctx = ResourceContext(config=config, state=None)
+        ctx = make_ctx(config)
 
         mock_registry = AsyncMock()
         mock_versions = [ModuleVersion(version="6.5.0")]
         mock_registry.list_module_versions = AsyncMock(return_value=mock_versions)
         mock_registry.get_module_details = AsyncMock(return_value=sample_module_response)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        ds = ModuleInfoDataSource()
 
         with patch("tofusoup.tf.components.data_sources.module_info.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            result = await ds.read(ctx)
+            mock_class.return_value = async_cm(mock_registry)
+            result = await module_info_ds.read(ctx)
 
         # Config values should be echoed back in state
         assert result.namespace == config.namespace
@@ -0,0 +1,64 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Shared fixtures for module_search data source tests."""
+
+from types import ModuleType
+
+import pytest
+from tofusoup.registry.models.module import Module  # type: ignore
+
+from tofusoup.tf.components.data_sources import module_search  # type: ignore
+from tofusoup.tf.components.data_sources.module_search import (  # type: ignore
+    ModuleSearchConfig,
+)
+
+
+def _fast_module(i: int) -> Module:
+    """Build the ``i``-th stub search result without running the attrs ``__init__``.
+
+    ``Module`` is slotted, so every slot is filled via ``object.__setattr__``. Only use this where a test
+    checks counts or limits, never attrs behaviour itself.
+    """
+    module = object.__new__(Module)
+    for field_name, value in (
+        ("id", f"namespace/module-{i}/aws"),
+        ("namespace", "namespace"),
+        ("name", f"module-{i}"),
+        ("provider_name", "aws"),
+        ("description", f"Module {i}"),
+        ("source_url", "https://github.com/example"),
+        ("downloads", 1000 * i),
+        ("verified", i % 3 == 0),
+        ("versions", ()),
+        ("latest_version", None),
+        ("registry_source", None),
+    ):
+        object.__setattr__(module, field_name, value)
+    return module
+
+
+@pytest.fixture(scope="module")
+def sample_config() -> ModuleSearchConfig:
+    """Sample valid module search config.
+
+    The config is frozen, so tests that need a variant derive one with ``attrs.evolve``.
+    """
+    return ModuleSearchConfig(query="vpc", registry="terraform", limit=20)
+
+
+@pytest.fixture(scope="session")
+def many_modules() -> tuple[Module, ...]:
+    """Fifty search results, built once per session; tests must treat them as read-only."""
+    return tuple(_fast_module(i) for i in range(50))
+
+
+@pytest.fixture(scope="session")
+def registry_module() -> ModuleType:
+    """The data source module whose registry clients ``use_registry`` replaces."""
+    return module_search
+
+
+# 🐍🧪🔚
@@ -10,12 +10,6 @@ from tofusoup.tf.components.data_sources.module_search import (  # type: ignore
 )
 
 
-@pytest.fixture
-def sample_config() -> ModuleSearchConfig:
-    """Sample valid module search config."""
-    return ModuleSearchConfig(query="vpc", registry="terraform", limit=20)
-
-
 class TestModuleSearchDataSource:
     """Unit tests for ModuleSearchDataSource class."""
 
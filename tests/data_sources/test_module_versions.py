@@ -1,7 +1,9 @@
 """Tests for tofusoup_module_versions data source."""
 
+from collections.abc import Callable
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from types import ModuleType
+from typing import Any
 
 import pytest
 from attrs import evolve
@@ -10,6 +12,7 @@ from pyvider.resources.context import ResourceContext  # type: ignore
 from pyvider.schema import PvsSchema  # type: ignore
 from tofusoup.registry.models.module import ModuleVersion  # type: ignore
 
+from tofusoup.tf.components.data_sources import module_versions  # type: ignore
 from tofusoup.tf.components.data_sources.module_versions import (  # type: ignore
     ModuleVersionsConfig,
     ModuleVersionsDataSource,
@@ -17,9 +20,9 @@ from tofusoup.tf.components.data_sources.module_versions import (  # type: ignor
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config() -> ModuleVersionsConfig:
-    """Sample valid module versions config."""
+    """Sample valid module versions config; frozen, so variants are derived with ``evolve``."""
     return ModuleVersionsConfig(
         namespace="terraform-aws-modules",
         name="vpc",
@@ -28,6 +31,38 @@ def sample_config() -> ModuleVersionsConfig:
     )
 
 
+@pytest.fixture
+def ctx(make_ctx: Callable[[Any], ResourceContext], sample_config: ModuleVersionsConfig) -> ResourceContext:
+    """Context for reading ``sample_config``; contexts carry diagnostics, so this stays function-scoped."""
+    return make_ctx(sample_config)
+
+
+@pytest.fixture(scope="session")
+def module_versions_schema() -> PvsSchema:
+    """The module_versions schema, fetched once per session."""
+    return ModuleVersionsDataSource.get_schema()
+
+
+@pytest.fixture(scope="session")
+def many_versions() -> tuple[ModuleVersion, ...]:
+    """Fifty versions of a popular module, built once per session; tests must treat them as read-only."""
+    published = [datetime(2025, month, 1) for month in range(1, 13)]
+    return tuple(
+        ModuleVersion(
+            version=f"6.{i}.0",
+            published_at=published[i % 12],
+            readme_content=f"# VPC Module v6.{i}.0",
+        )
+        for i in range(50)
+    )
+
+
+@pytest.fixture(scope="session")
+def registry_module() -> ModuleType:
+    """The data source module whose registry clients ``use_registry`` replaces."""
+    return module_versions
+
+
 class TestModuleVersionsDataSource:
     """Unit tests for ModuleVersionsDataSource class."""
 
@@ -39,9 +74,9 @@ class TestModuleVersionsDataSource:
         """Test that state_class is correctly set."""
         assert ModuleVersionsDataSource.state_class == ModuleVersionsState
 
-    def test_get_schema_returns_valid_schema(self) -> None:
+    def test_get_schema_returns_valid_schema(self, module_versions_schema: PvsSchema) -> None:
         """Test that get_schema returns a valid PvsSchema."""
-        schema = ModuleVersionsDataSource.get_schema()
+        schema = module_versions_schema
         assert isinstance(schema, PvsSchema)
         # Schema has a block attribute which contains the attributes
         assert "namespace" in schema.block.attributes
@@ -51,9 +86,13 @@ class TestModuleVersionsDataSource:
         assert "version_count" in schema.block.attributes
         assert "versions" in schema.block.attributes
 
-    def test_schema_has_required_attributes(self) -> None:
+    def test_get_schema_is_cached(self, module_versions_schema: PvsSchema) -> None:
+        """Test that get_schema returns the same frozen schema on every call."""
+        assert ModuleVersionsDataSource.get_schema() is module_versions_schema
+
+    def test_schema_has_required_attributes(self, module_versions_schema: PvsSchema) -> None:
         """Test that schema defines all required attributes."""
-        schema = ModuleVersionsDataSource.get_schema()
+        schema = module_versions_schema
         attrs = schema.block.attributes
 
         # Input attributes
@@ -66,9 +105,9 @@ class TestModuleVersionsDataSource:
         assert attrs["version_count"].computed is True
         assert attrs["versions"].computed is True
 
-    def test_schema_registry_has_default(self) -> None:
+    def test_schema_registry_has_default(self, module_versions_schema: PvsSchema) -> None:
         """Test that registry attribute has default value."""
-        schema = ModuleVersionsDataSource.get_schema()
+        schema = module_versions_schema
         registry_attr = schema.block.attributes["registry"]
         assert registry_attr.default == "terraform"
 
@@ -82,55 +121,42 @@ class TestModuleVersionsDataSource:
         with pytest.raises(Exception):  # attrs frozen classes raise on modification
             config.namespace = "other"  # type: ignore
 
+    def test_config_and_state_are_slotted(self, sample_config: ModuleVersionsConfig) -> None:
+        """Test that config and state instances carry neither a __dict__ nor a weakref slot."""
+        for instance in (sample_config, ModuleVersionsState()):
+            assert not hasattr(instance, "__dict__")
+            assert not hasattr(instance, "__weakref__")
+
 
 class TestModuleVersionsValidation:
     """Tests for configuration validation."""
 
-    @pytest.mark.asyncio
-    async def test_validate_config_valid(self, sample_config: ModuleVersionsConfig) -> None:
-        """Test validation passes for valid config."""
-        ds = ModuleVersionsDataSource()
-        errors = await ds._validate_config(sample_config)
+    async def test_validate_config_valid(
+        self, sample_config: ModuleVersionsConfig, module_versions_ds
+    ) -> None:
+        """Test validation passes for valid config through the async validate() entry point."""
+        errors = await module_versions_ds.validate(sample_config)
         assert errors == []
 
-    @pytest.mark.asyncio
-    async def test_validate_config_empty_namespace(self, sample_config: ModuleVersionsConfig) -> None:
-        """Test validation fails for empty namespace."""
-        invalid_config = evolve(sample_config, namespace="")
-        ds = ModuleVersionsDataSource()
-        errors = await ds._validate_config(invalid_config)
-        assert len(errors) == 1
-        assert "'namespace' is required" in errors[0]
-
-    @pytest.mark.asyncio
-    async def test_validate_config_empty_name(self, sample_config: ModuleVersionsConfig) -> None:
-        """Test validation fails for empty name."""
-        invalid_config = evolve(sample_config, name="")
-        ds = ModuleVersionsDataSource()
-        errors = await ds._validate_config(invalid_config)
-        assert len(errors) == 1
-        assert "'name' is required" in errors[0]
-
-    @pytest.mark.asyncio
-    async def test_validate_config_empty_target_provider(self, sample_config: ModuleVersionsConfig) -> None:
-        """Test validation fails for empty target_provider."""
-        invalid_config = evolve(sample_config, target_provider="")
-        ds = ModuleVersionsDataSource()
-        errors = await ds._validate_config(invalid_config)
-        assert len(errors) == 1
-        assert "'target_provider' is required" in errors[0]
-
-    @pytest.mark.asyncio
-    async def test_validate_config_invalid_registry(self, sample_config: ModuleVersionsConfig) -> None:
-        """Test validation fails for invalid registry."""
-        invalid_config = evolve(sample_config, registry="invalid")
-        ds = ModuleVersionsDataSource()
-        errors = await ds._validate_config(invalid_config)
+    @pytest.mark.parametrize(
+        ("field", "value", "expected"),
+        [
+            ("namespace", "", "'namespace' is required"),
+            ("name", "", "'name' is required"),
+            ("target_provider", "", "'target_provider' is required"),
+            ("registry", "invalid", "'registry' must be either 'terraform' or 'opentofu'"),
+        ],
+    )
+    def test_validate_config_invalid(
+        self, sample_config: ModuleVersionsConfig, field: str, value: str, expected: str, module_versions_ds
+    ) -> None:
+        """Test validation reports exactly one error for each invalid field."""
+        invalid_config = evolve(sample_config, **{field: value})
+        errors = module_versions_ds._validate_config_sync(invalid_config)
         assert len(errors) == 1
-        assert "'registry' must be either 'terraform' or 'opentofu'" in errors[0]
+        assert expected in errors[0]
 
-    @pytest.mark.asyncio
-    async def test_validate_config_multiple_errors(self) -> None:
+    def test_validate_config_multiple_errors(self, module_versions_ds) -> None:
         """Test validation returns multiple errors."""
         invalid_config = ModuleVersionsConfig(
             namespace="",
@@ -138,35 +164,40 @@ class TestModuleVersionsValidation:
             target_provider="",
             registry="bad",
         )
-        ds = ModuleVersionsDataSource()
-        errors = await ds._validate_config(invalid_config)
+        errors = module_versions_ds._validate_config_sync(invalid_config)
         assert len(errors) == 4
 
 
+@pytest.mark.usefixtures("registry_classes")
 class TestModuleVersionsRead:
     """Tests for read() method."""
 
-    @pytest.mark.asyncio
-    async def test_read_terraform_registry(
-        self, sample_config: ModuleVersionsConfig, sample_module_versions: list[ModuleVersion]
+    @pytest.mark.parametrize("which", ["terraform", "opentofu"])
+    async def test_read_registry(
+        self,
+        which: str,
+        sample_config: ModuleVersionsConfig,
+        sample_module_versions: tuple[ModuleVersion, ...],
+        mock_registry_factory,
+        use_registry,
+        registry_classes,
+        module_versions_ds,
+        make_ctx,
     ) -> None:
-        """Test reading from Terraform registry."""
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        """Test reading from each registry uses only that registry's client."""
+        ctx = make_ctx(evolve(sample_config, registry=which))
 
-        mock_registry = AsyncMock()
-        mock_registry.list_module_versions = AsyncMock(return_value=sample_module_versions)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(list_module_versions={"return_value": sample_module_versions})
 
-        with patch("tofusoup.tf.components.data_sources.module_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        use_registry(mock_registry, which=which)
+        state = await module_versions_ds.read(ctx)
 
+        other = "opentofu" if which == "terraform" else "terraform"
+        registry_classes[other].assert_not_called()
         assert state.namespace == "terraform-aws-modules"
         assert state.name == "vpc"
         assert state.target_provider == "aws"
-        assert state.registry == "terraform"
+        assert state.registry == which
         assert state.version_count == 3
         assert state.versions is not None
         assert len(state.versions) == 3
@@ -174,88 +205,54 @@ class TestModuleVersionsRead:
         assert state.versions[0]["published_at"] == "2025-10-21T21:09:25.665344"
         assert state.versions[0]["readme_content"] == "# VPC Module"
 
-    @pytest.mark.asyncio
-    async def test_read_opentofu_registry(self, sample_module_versions: list[ModuleVersion]) -> None:
-        """Test reading from OpenTofu registry."""
-        config = ModuleVersionsConfig(
-            namespace="Azure",
-            name="compute",
-            target_provider="azurerm",
-            registry="opentofu",
-        )
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=config, state=None)
-
-        mock_registry = AsyncMock()
-        mock_registry.list_module_versions = AsyncMock(return_value=sample_module_versions)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("tofusoup.tf.components.data_sources.module_versions.OpenTofuRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
-
-        assert state.namespace == "Azure"
-        assert state.target_provider == "azurerm"
-        assert state.registry == "opentofu"
-        assert state.version_count == 3
-
-    @pytest.mark.asyncio
-    async def test_read_default_registry(self, sample_module_versions: list[ModuleVersion]) -> None:
+    async def test_read_default_registry(
+        self,
+        sample_module_versions: tuple[ModuleVersion, ...],
+        mock_registry_factory,
+        use_registry,
+        module_versions_ds,
+        make_ctx,
+    ) -> None:
         """Test that default registry is Terraform."""
         config = ModuleVersionsConfig(
             namespace="terraform-aws-modules",
             name="vpc",
             target_provider="aws",
         )
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=config, state=None)
+        ctx = make_ctx(config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_module_versions = AsyncMock(return_value=sample_module_versions)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(list_module_versions={"return_value": sample_module_versions})
 
-        with patch("tofusoup.tf.components.data_sources.module_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await module_versions_ds.read(ctx)
 
         assert state.registry == "terraform"
 
-    @pytest.mark.asyncio
-    async def test_read_empty_results(self, sample_config: ModuleVersionsConfig) -> None:
+    async def test_read_empty_results(
+        self, mock_registry_factory, use_registry, module_versions_ds, ctx
+    ) -> None:
         """Test read with no versions found."""
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        mock_registry = mock_registry_factory(list_module_versions={"return_value": []})
 
-        mock_registry = AsyncMock()
-        mock_registry.list_module_versions = AsyncMock(return_value=[])
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("tofusoup.tf.components.data_sources.module_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await module_versions_ds.read(ctx)
 
         assert state.version_count == 0
         assert state.versions == []
 
-    @pytest.mark.asyncio
     async def test_read_version_conversion(
-        self, sample_config: ModuleVersionsConfig, sample_module_versions: list[ModuleVersion]
+        self,
+        sample_module_versions: tuple[ModuleVersion, ...],
+        mock_registry_factory,
+        use_registry,
+        module_versions_ds,
+        ctx,
     ) -> None:
         """Test that ModuleVersion objects are correctly converted to dicts."""
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
-
-        mock_registry = AsyncMock()
-        mock_registry.list_module_versions = AsyncMock(return_value=sample_module_versions)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(list_module_versions={"return_value": sample_module_versions})
 
-        with patch("tofusoup.tf.components.data_sources.module_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await module_versions_ds.read(ctx)
 
         # Verify structure
         assert isinstance(state.versions, list)
@@ -270,8 +267,9 @@ class TestModuleVersionsRead:
         assert isinstance(version["outputs"], list)
         assert isinstance(version["resources"], list)
 
-    @pytest.mark.asyncio
-    async def test_read_with_single_version(self, sample_config: ModuleVersionsConfig) -> None:
+    async def test_read_with_single_version(
+        self, mock_registry_factory, use_registry, module_versions_ds, ctx
+    ) -> None:
         """Test read with single version."""
         single_version = [
             ModuleVersion(
@@ -281,218 +279,157 @@ class TestModuleVersionsRead:
             )
         ]
 
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
-
-        mock_registry = AsyncMock()
-        mock_registry.list_module_versions = AsyncMock(return_value=single_version)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(list_module_versions={"return_value": single_version})
 
-        with patch("tofusoup.tf.components.data_sources.module_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await module_versions_ds.read(ctx)
 
         assert state.version_count == 1
         assert len(state.versions) == 1
         assert state.versions[0]["version"] == "1.0.0"
 
-    @pytest.mark.asyncio
-    async def test_read_passes_module_id(self, sample_config: ModuleVersionsConfig) -> None:
+    async def test_read_passes_module_id(
+        self, mock_registry_factory, use_registry, module_versions_ds, ctx
+    ) -> None:
         """Test that read passes correct module_id to registry."""
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
-
-        mock_registry = AsyncMock()
-        mock_registry.list_module_versions = AsyncMock(return_value=[])
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(list_module_versions={"return_value": []})
 
-        with patch("tofusoup.tf.components.data_sources.module_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            await ds.read(ctx)
+        use_registry(mock_registry)
+        await module_versions_ds.read(ctx)
 
         mock_registry.list_module_versions.assert_called_once_with("terraform-aws-modules/vpc/aws")
 
-    @pytest.mark.asyncio
     async def test_read_preserves_config_values(
-        self, sample_config: ModuleVersionsConfig, sample_module_versions: list[ModuleVersion]
+        self,
+        sample_config: ModuleVersionsConfig,
+        sample_module_versions: tuple[ModuleVersion, ...],
+        mock_registry_factory,
+        use_registry,
+        module_versions_ds,
+        ctx,
     ) -> None:
         """Test that config values are preserved in state."""
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        mock_registry = mock_registry_factory(list_module_versions={"return_value": sample_module_versions})
 
-        mock_registry = AsyncMock()
-        mock_registry.list_module_versions = AsyncMock(return_value=sample_module_versions)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("tofusoup.tf.components.data_sources.module_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await module_versions_ds.read(ctx)
 
         assert state.namespace == sample_config.namespace
         assert state.name == sample_config.name
         assert state.target_provider == sample_config.target_provider
         assert state.registry == sample_config.registry
 
+    async def test_read_leaves_data_source_unchanged(
+        self,
+        sample_module_versions: tuple[ModuleVersion, ...],
+        mock_registry_factory,
+        use_registry,
+        module_versions_ds,
+        ctx,
+    ) -> None:
+        """Test that read keeps no state on the instance, so one data source can serve every test."""
+        before = dict(vars(module_versions_ds))
+
+        use_registry(mock_registry_factory(list_module_versions={"return_value": sample_module_versions}))
+        await module_versions_ds.read(ctx)
+
+        assert vars(module_versions_ds) == before
+
 
+@pytest.mark.usefixtures("registry_classes")
 class TestModuleVersionsErrorHandling:
     """Tests for error scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_read_without_config(self) -> None:
+    async def test_read_without_config(self, module_versions_ds, make_ctx) -> None:
         """Test read raises error without config."""
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=None, state=None)
+        ctx = make_ctx(None)
 
         with pytest.raises(DataSourceError, match="Configuration is required"):
-            await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_registry_error(self, sample_config: ModuleVersionsConfig) -> None:
-        """Test read handles registry errors."""
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
-
-        mock_registry = AsyncMock()
-        mock_registry.list_module_versions = AsyncMock(side_effect=Exception("Network error"))
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with patch("tofusoup.tf.components.data_sources.module_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-
-            with pytest.raises(DataSourceError, match="Failed to query module versions"):
-                await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_opentofu_registry_error(self) -> None:
-        """Test read handles OpenTofu registry errors."""
-        config = ModuleVersionsConfig(
-            namespace="Azure",
-            name="compute",
-            target_provider="azurerm",
-            registry="opentofu",
-        )
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=config, state=None)
+            await module_versions_ds.read(ctx)
+
+    @pytest.mark.parametrize("which", ["terraform", "opentofu"])
+    async def test_read_registry_error(
+        self,
+        which: str,
+        sample_config: ModuleVersionsConfig,
+        mock_registry_factory,
+        use_registry,
+        module_versions_ds,
+        make_ctx,
+    ) -> None:
+        """Test read wraps errors from either registry."""
+        ctx = make_ctx(evolve(sample_config, registry=which))
 
-        mock_registry = AsyncMock()
-        mock_registry.list_module_versions = AsyncMock(side_effect=Exception("API error"))
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(list_module_versions={"side_effect": Exception("Network error")})
 
-        with patch("tofusoup.tf.components.data_sources.module_versions.OpenTofuRegistry") as mock_class:
-            mock_class.return_value = mock_registry
+        use_registry(mock_registry, which=which)
 
-            with pytest.raises(DataSourceError, match="Failed to query module versions"):
-                await ds.read(ctx)
+        with pytest.raises(DataSourceError, match=f"Failed to query module versions .* from {which} registry"):
+            await module_versions_ds.read(ctx)
 
-    @pytest.mark.asyncio
-    async def test_read_includes_module_info_in_error(self, sample_config: ModuleVersionsConfig) -> None:
+    async def test_read_includes_module_info_in_error(
+        self, mock_registry_factory, use_registry, module_versions_ds, ctx
+    ) -> None:
         """Test error message includes module namespace/name/provider."""
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
-
-        mock_registry = AsyncMock()
-        mock_registry.list_module_versions = AsyncMock(side_effect=Exception("Error"))
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(list_module_versions={"side_effect": Exception("Error")})
 
-        with patch("tofusoup.tf.components.data_sources.module_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
+        use_registry(mock_registry)
 
-            with pytest.raises(DataSourceError, match="terraform-aws-modules/vpc/aws"):
-                await ds.read(ctx)
+        with pytest.raises(DataSourceError, match="terraform-aws-modules/vpc/aws"):
+            await module_versions_ds.read(ctx)
 
-    @pytest.mark.asyncio
-    async def test_read_includes_registry_in_error(self, sample_config: ModuleVersionsConfig) -> None:
+    async def test_read_includes_registry_in_error(
+        self, mock_registry_factory, use_registry, module_versions_ds, ctx
+    ) -> None:
         """Test error message includes registry name."""
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
-
-        mock_registry = AsyncMock()
-        mock_registry.list_module_versions = AsyncMock(side_effect=Exception("Error"))
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(list_module_versions={"side_effect": Exception("Error")})
 
-        with patch("tofusoup.tf.components.data_sources.module_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
+        use_registry(mock_registry)
 
-            with pytest.raises(DataSourceError, match="terraform registry"):
-                await ds.read(ctx)
+        with pytest.raises(DataSourceError, match="terraform registry"):
+            await module_versions_ds.read(ctx)
 
 
 class TestModuleVersionsEdgeCases:
     """Edge case tests."""
 
-    @pytest.mark.asyncio
-    async def test_convert_version_with_no_published_at(self, sample_config: ModuleVersionsConfig) -> None:
-        """Test conversion of version with no published_at date."""
-        version_no_date = ModuleVersion(version="1.0.0", published_at=None)
-
-        ds = ModuleVersionsDataSource()
-        result = ds._convert_version_to_dict(version_no_date)
-
-        assert result["published_at"] is None
-
-    @pytest.mark.asyncio
-    async def test_convert_version_with_no_readme(self, sample_config: ModuleVersionsConfig) -> None:
-        """Test conversion of version with no readme_content."""
-        version_no_readme = ModuleVersion(
-            version="1.0.0",
-            published_at=datetime.fromisoformat("2025-01-01T00:00:00"),
-            readme_content=None,
-        )
-
-        ds = ModuleVersionsDataSource()
-        result = ds._convert_version_to_dict(version_no_readme)
-
-        assert result["readme_content"] is None
-
-    @pytest.mark.asyncio
-    async def test_read_with_many_versions(self, sample_config: ModuleVersionsConfig) -> None:
+    @pytest.mark.parametrize(
+        ("fields", "expected"),
+        [
+            pytest.param({"published_at": None}, {"published_at": None}, id="no_published_at"),
+            pytest.param(
+                {"published_at": datetime(2025, 1, 1), "readme_content": None},
+                {"readme_content": None},
+                id="no_readme",
+            ),
+            pytest.param(
+                {"published_at": datetime(2025, 1, 1), "inputs": [], "outputs": [], "resources": []},
+                {"inputs": [], "outputs": [], "resources": []},
+                id="empty_lists",
+            ),
+        ],
+    )
+    def test_convert_version_with_missing_fields(
+        self, fields: dict[str, Any], expected: dict[str, Any], module_versions_ds
+    ) -> None:
+        """Test conversion of versions with no date, no readme, or empty inputs/outputs/resources."""
+        result = module_versions_ds._convert_version_to_dict(ModuleVersion(version="1.0.0", **fields))
+
+        assert {key: result[key] for key in expected} == expected
+
+    async def test_read_with_many_versions(
+        self,
+        many_versions: tuple[ModuleVersion, ...],
+        mock_registry_factory,
+        use_registry,
+        module_versions_ds,
+        ctx,
+    ) -> None:
         """Test read with large number of versions (simulating popular module)."""
-        # Create 50 versions to simulate real-world scenario
-        many_versions = [
-            ModuleVersion(
-                version=f"6.{i}.0",
-                published_at=datetime.fromisoformat(f"2025-{(i % 12) + 1:02d}-01T00:00:00"),
-                readme_content=f"# VPC Module v6.{i}.0",
-            )
-            for i in range(50)
-        ]
-
-        ds = ModuleVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
-
-        mock_registry = AsyncMock()
-        mock_registry.list_module_versions = AsyncMock(return_value=many_versions)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(list_module_versions={"return_value": many_versions})
 
-        with patch("tofusoup.tf.components.data_sources.module_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await module_versions_ds.read(ctx)
 
         assert state.version_count == 50
         assert len(state.versions) == 50
-
-    @pytest.mark.asyncio
-    async def test_convert_version_with_empty_lists(self, sample_config: ModuleVersionsConfig) -> None:
-        """Test conversion of version with empty inputs/outputs/resources."""
-        version = ModuleVersion(
-            version="1.0.0",
-            published_at=datetime.fromisoformat("2025-01-01T00:00:00"),
-            inputs=[],
-            outputs=[],
-            resources=[],
-        )
-
-        ds = ModuleVersionsDataSource()
-        result = ds._convert_version_to_dict(version)
-
-        assert result["inputs"] == []
-        assert result["outputs"] == []
-        assert result["resources"] == []
@@ -5,14 +5,20 @@
 
 """Tests for tofusoup_provider_info data source."""
 
+import json
+from collections.abc import Callable, Iterator, Mapping
 from typing import Any
+from unittest.mock import AsyncMock
 
+import httpx
 import pytest
+import respx
+from attrs import fields, fields_dict
 from attrs.exceptions import FrozenInstanceError
-from pytest_httpx import HTTPXMock
 from pyvider.exceptions import DataSourceError  # type: ignore
 from pyvider.resources.context import ResourceContext  # type: ignore
 from pyvider.schema import PvsSchema  # type: ignore
+from respx import MockRouter
 
 from tofusoup.tf.components.data_sources.provider_info import (  # type: ignore
     ProviderInfoConfig,
@@ -20,6 +26,80 @@ from tofusoup.tf.components.data_sources.provider_info import (  # type: ignore
     ProviderInfoState,
 )
 
+_NAMESPACE_REQUIRED = "'namespace' is required and cannot be empty."
+_NAME_REQUIRED = "'name' is required and cannot be empty."
+_REGISTRY_INVALID = "'registry' must be either 'terraform' or 'opentofu'."
+_JSON_HEADERS = {"content-type": "application/json"}
+# The provider most tests read; matches the shared sample_config and sample_terraform_response
+_NAMESPACE = "hashicorp"
+_NAME = "aws"
+_REGISTRY = "terraform"
+_AWS_PATH = f"/v1/providers/{_NAMESPACE}/{_NAME}"
+_TERRAFORM_PROVIDERS = "https://registry.terraform.io/v1/providers"
+_OPENTOFU_PROVIDERS = "https://registry.opentofu.org/v1/providers"
+# The registry client reads ``e.request`` when logging failures, so stubbed responses and errors carry one
+_AWS_REQUEST = httpx.Request("GET", f"https://registry.terraform.io{_AWS_PATH}")
+
+
+# Canned registry payloads are serialized once at import, so tests register raw content rather than
+# re-encoding a dict per test.
+
+# Response with minimal fields (only required ones)
+_MINIMAL_RESPONSE_BODY = json.dumps({"namespace": _NAMESPACE, "name": "minimal"}).encode()
+_EXTRA_FIELDS_RESPONSE_BODY = json.dumps(
+    {
+        "namespace": _NAMESPACE,
+        "name": "extras",
+        "version": "5.31.0",
+        "description": "AWS Provider",
+        "source": "https://github.com/hashicorp/terraform-provider-aws",
+        "downloads": 1000000,
+        "published_at": "2024-01-15T10:30:00Z",
+        # Extra fields that don't map to our schema
+        "extra_field_1": "ignored",
+        "extra_field_2": 12345,
+        "nested": {"should": "be_ignored"},
+    }
+).encode()
+
+
+def _not_found_message(namespace: str, name: str) -> str:
+    """The error read raises when the Terraform registry returns no details, after its outer wrap."""
+    return (
+        f"Failed to query provider info for {namespace}/{name} from terraform registry: "
+        f"Provider {namespace}/{name} not found in terraform registry"
+    )
+
+
+@pytest.fixture
+def ctx(make_ctx: Callable[[Any], ResourceContext], sample_config: ProviderInfoConfig) -> ResourceContext:
+    """Context for reading ``sample_config``; contexts carry diagnostics, so this stays function-scoped."""
+    return make_ctx(sample_config)
+
+
+@pytest.fixture(scope="module")
+def registry_routes(
+    sample_terraform_response_body: bytes, sample_opentofu_response_body: bytes
+) -> Iterator[MockRouter]:
+    """Route table for every registry URL this module reads, installed once per module.
+
+    Each scenario has its own provider path and canned response, so no test reconfigures a route and the
+    table can be shared. Requests to unlisted URLs still fail, since respx asserts that every call is mocked.
+    """
+    with respx.mock(assert_all_called=False) as router:
+        for path, body in (
+            (f"{_NAMESPACE}/{_NAME}", sample_terraform_response_body),
+            ("hashicorp/minimal", _MINIMAL_RESPONSE_BODY),
+            ("hashicorp/extras", _EXTRA_FIELDS_RESPONSE_BODY),
+        ):
+            router.get(f"{_TERRAFORM_PROVIDERS}/{path}").respond(content=body, headers=_JSON_HEADERS)
+        router.get(f"{_OPENTOFU_PROVIDERS}/hashicorp/random").respond(
+            content=sample_opentofu_response_body, headers=_JSON_HEADERS
+        )
+        for name, status_code in (("not-found", 404), ("forbidden", 403)):
+            router.get(f"{_TERRAFORM_PROVIDERS}/failing/{name}").respond(status_code)
+        yield router
+
 
 class TestProviderInfoDataSource:
     """Unit tests for ProviderInfoDataSource class."""
@@ -45,141 +125,97 @@ class TestProviderInfoDataSource:
         assert "downloads" in schema.block.attributes
         assert "published_at" in schema.block.attributes
 
-    def test_config_class_is_frozen(self) -> None:
-        """Test that ProviderInfoConfig is immutable (frozen)."""
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform")
-
-        with pytest.raises(FrozenInstanceError):
-            config.namespace = "new_namespace"
-
-    def test_state_class_is_frozen(self) -> None:
-        """Test that ProviderInfoState is immutable (frozen)."""
-        state = ProviderInfoState(namespace="hashicorp", name="aws", latest_version="5.31.0")
-
-        with pytest.raises(FrozenInstanceError):
-            state.latest_version = "6.0.0"
+    def test_get_schema_is_cached(self) -> None:
+        """Test that get_schema returns the same frozen schema on every call."""
+        assert ProviderInfoDataSource.get_schema() is ProviderInfoDataSource.get_schema()
 
     def test_config_defaults(self) -> None:
         """Test that ProviderInfoConfig has correct default values."""
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws")
-        assert config.registry == "terraform"
+        assert fields_dict(ProviderInfoConfig)["registry"].default == _REGISTRY
 
     def test_state_defaults(self) -> None:
-        """Test that ProviderInfoState has all None defaults."""
-        state = ProviderInfoState()
-        assert state.namespace is None
-        assert state.name is None
-        assert state.registry is None
-        assert state.latest_version is None
-        assert state.description is None
-        assert state.source_url is None
-        assert state.downloads is None
-        assert state.published_at is None
+        """Test that ProviderInfoState has all None defaults, read from the attrs field metadata."""
+        state_fields = fields(ProviderInfoState)
+        assert [f.name for f in state_fields] == [
+            "namespace",
+            "name",
+            "registry",
+            "latest_version",
+            "description",
+            "source_url",
+            "downloads",
+            "published_at",
+        ]
+        assert all(f.default is None for f in state_fields)
 
 
 class TestProviderInfoValidation:
     """Tests for configuration validation."""
 
-    @pytest.mark.asyncio
-    async def test_validate_empty_namespace_returns_error(self) -> None:
-        """Test validation fails when namespace is empty."""
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="", name="aws", registry="terraform")
-
-        errors = await ds._validate_config(config)
-
-        assert len(errors) == 1
-        assert "'namespace' is required and cannot be empty." in errors
-
-    @pytest.mark.asyncio
-    async def test_validate_empty_name_returns_error(self) -> None:
-        """Test validation fails when name is empty."""
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="hashicorp", name="", registry="terraform")
-
-        errors = await ds._validate_config(config)
-
-        assert len(errors) == 1
-        assert "'name' is required and cannot be empty." in errors
-
-    @pytest.mark.asyncio
-    async def test_validate_invalid_registry_returns_error(self) -> None:
-        """Test validation fails when registry is invalid."""
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws", registry="invalid")
-
-        errors = await ds._validate_config(config)
-
-        assert len(errors) == 1
-        assert "'registry' must be either 'terraform' or 'opentofu'." in errors
-
-    @pytest.mark.asyncio
-    async def test_validate_valid_config_returns_no_errors(self) -> None:
-        """Test validation passes with valid config."""
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform")
-
-        errors = await ds._validate_config(config)
+    async def test_validate_valid_config_returns_no_errors(
+        self, provider_info_ds: ProviderInfoDataSource, sample_config: ProviderInfoConfig
+    ) -> None:
+        """Test validation passes with valid config through the async validate() entry point."""
+        errors = await provider_info_ds.validate(sample_config)
 
         assert len(errors) == 0
 
-    @pytest.mark.asyncio
-    async def test_validate_multiple_errors_returns_all(self) -> None:
-        """Test validation returns all errors when multiple fields are invalid."""
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="", name="", registry="invalid")
+    @pytest.mark.parametrize(
+        ("namespace", "name", "registry", "expected"),
+        [
+            ("", _NAME, _REGISTRY, {_NAMESPACE_REQUIRED}),
+            (_NAMESPACE, "", _REGISTRY, {_NAME_REQUIRED}),
+            (_NAMESPACE, _NAME, "invalid", {_REGISTRY_INVALID}),
+            ("", "", "invalid", {_NAMESPACE_REQUIRED, _NAME_REQUIRED, _REGISTRY_INVALID}),
+        ],
+        ids=["empty_namespace", "empty_name", "invalid_registry", "multiple_errors"],
+    )
+    def test_validate_invalid_config_returns_errors(
+        self,
+        provider_info_ds: ProviderInfoDataSource,
+        namespace: str,
+        name: str,
+        registry: str,
+        expected: set[str],
+    ) -> None:
+        """Test validation reports every invalid field, and only those."""
+        config = ProviderInfoConfig(namespace=namespace, name=name, registry=registry)
 
-        errors = await ds._validate_config(config)
+        errors = provider_info_ds._validate_config_sync(config)
 
-        assert len(errors) == 3
-        assert "'namespace' is required and cannot be empty." in errors
-        assert "'name' is required and cannot be empty." in errors
-        assert "'registry' must be either 'terraform' or 'opentofu'." in errors
+        assert len(errors) == len(expected)
+        assert set(errors) == expected
 
 
+@pytest.mark.usefixtures("registry_routes")
 class TestProviderInfoRead:
     """Tests for read() method."""
 
-    @pytest.mark.asyncio
     async def test_read_terraform_registry_success(
-        self, httpx_mock: HTTPXMock, sample_terraform_response: dict[str, Any]
+        self, provider_info_ds: ProviderInfoDataSource, ctx: ResourceContext
     ) -> None:
         """Test successful read from Terraform registry."""
-        httpx_mock.add_response(
-            url="https://registry.terraform.io/v1/providers/hashicorp/aws", json=sample_terraform_response
-        )
-
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform")
-        ctx = ResourceContext(config=config)
+        result = await provider_info_ds.read(ctx)
 
-        result = await ds.read(ctx)
-
-        assert result.namespace == "hashicorp"
-        assert result.name == "aws"
-        assert result.registry == "terraform"
+        # namespace, name and registry echo the config
+        assert result.namespace == _NAMESPACE
+        assert result.name == _NAME
+        assert result.registry == _REGISTRY
         assert result.latest_version == "5.31.0"
         assert result.description == "Terraform AWS provider"
         assert result.source_url == "https://github.com/hashicorp/terraform-provider-aws"
         assert result.downloads == 1000000
         assert result.published_at == "2024-01-15T10:30:00Z"
 
-    @pytest.mark.asyncio
     async def test_read_opentofu_registry_success(
-        self, httpx_mock: HTTPXMock, sample_opentofu_response: dict[str, Any]
+        self, provider_info_ds: ProviderInfoDataSource, make_ctx: Callable[[Any], ResourceContext]
     ) -> None:
         """Test successful read from OpenTofu registry."""
-        httpx_mock.add_response(
-            url="https://registry.opentofu.org/v1/providers/hashicorp/random", json=sample_opentofu_response
-        )
+        ctx = make_ctx(ProviderInfoConfig(namespace=_NAMESPACE, name="random", registry="opentofu"))
 
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="hashicorp", name="random", registry="opentofu")
-        ctx = ResourceContext(config=config)
-
-        result = await ds.read(ctx)
+        result = await provider_info_ds.read(ctx)
 
-        assert result.namespace == "hashicorp"
+        assert result.namespace == _NAMESPACE
         assert result.name == "random"
         assert result.registry == "opentofu"
         assert result.latest_version == "3.6.0"
@@ -188,230 +224,139 @@ class TestProviderInfoRead:
         assert result.downloads == 500000
         assert result.published_at == "2024-01-10T08:00:00Z"
 
-    @pytest.mark.asyncio
     async def test_read_default_registry_uses_terraform(
-        self, httpx_mock: HTTPXMock, sample_terraform_response: dict[str, Any]
+        self, provider_info_ds: ProviderInfoDataSource, make_ctx: Callable[[Any], ResourceContext]
     ) -> None:
         """Test that default registry value uses Terraform registry."""
-        httpx_mock.add_response(
-            url="https://registry.terraform.io/v1/providers/hashicorp/aws", json=sample_terraform_response
-        )
-
-        ds = ProviderInfoDataSource()
         # Not specifying registry, should default to "terraform"
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws")
-        ctx = ResourceContext(config=config)
+        ctx = make_ctx(ProviderInfoConfig(namespace=_NAMESPACE, name=_NAME))
 
-        result = await ds.read(ctx)
+        result = await provider_info_ds.read(ctx)
 
-        assert result.registry == "terraform"
+        assert result.registry == _REGISTRY
         assert result.latest_version == "5.31.0"
 
-    @pytest.mark.asyncio
     async def test_read_maps_all_response_fields(
-        self, httpx_mock: HTTPXMock, sample_terraform_response: dict[str, Any]
+        self,
+        sample_terraform_response: Mapping[str, Any],
+        provider_info_ds: ProviderInfoDataSource,
+        ctx: ResourceContext,
     ) -> None:
         """Test that all fields from registry response are mapped correctly."""
-        httpx_mock.add_response(
-            url="https://registry.terraform.io/v1/providers/hashicorp/aws", json=sample_terraform_response
-        )
-
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform")
-        ctx = ResourceContext(config=config)
-
-        result = await ds.read(ctx)
+        result = await provider_info_ds.read(ctx)
 
         # Verify all response fields are mapped
-        assert result.latest_version == sample_terraform_response["version"]
-        assert result.description == sample_terraform_response["description"]
-        assert result.source_url == sample_terraform_response["source"]
-        assert result.downloads == sample_terraform_response["downloads"]
-        assert result.published_at == sample_terraform_response["published_at"]
-
-    @pytest.mark.asyncio
-    async def test_read_handles_missing_optional_fields(self, httpx_mock: HTTPXMock) -> None:
-        """Test that read handles missing optional fields gracefully."""
-        # Response with minimal fields (only required ones)
-        minimal_response = {
-            "namespace": "hashicorp",
-            "name": "aws",
-        }
-
-        httpx_mock.add_response(
-            url="https://registry.terraform.io/v1/providers/hashicorp/aws", json=minimal_response
+        assert result == ProviderInfoState(
+            namespace=_NAMESPACE,
+            name=_NAME,
+            registry=_REGISTRY,
+            latest_version=sample_terraform_response["version"],
+            description=sample_terraform_response["description"],
+            source_url=sample_terraform_response["source"],
+            downloads=sample_terraform_response["downloads"],
+            published_at=sample_terraform_response["published_at"],
         )
 
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform")
-        ctx = ResourceContext(config=config)
+    async def test_read_handles_missing_optional_fields(
+        self, provider_info_ds: ProviderInfoDataSource, make_ctx: Callable[[Any], ResourceContext]
+    ) -> None:
+        """Test that read handles missing optional fields gracefully."""
+        ctx = make_ctx(ProviderInfoConfig(namespace=_NAMESPACE, name="minimal"))
 
-        result = await ds.read(ctx)
+        result = await provider_info_ds.read(ctx)
 
         # Should not crash, optional fields should be None
-        assert result.namespace == "hashicorp"
-        assert result.name == "aws"
+        assert result.namespace == _NAMESPACE
+        assert result.name == "minimal"
         assert result.latest_version is None
         assert result.description is None
         assert result.source_url is None
         assert result.downloads is None
         assert result.published_at is None
 
-    @pytest.mark.asyncio
-    async def test_read_preserves_config_values(
-        self, httpx_mock: HTTPXMock, sample_terraform_response: dict[str, Any]
-    ) -> None:
-        """Test that config values are preserved in the result state."""
-        httpx_mock.add_response(
-            url="https://registry.terraform.io/v1/providers/hashicorp/aws", json=sample_terraform_response
-        )
-
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform")
-        ctx = ResourceContext(config=config)
-
-        result = await ds.read(ctx)
-
-        # Config values should be echoed back in state
-        assert result.namespace == config.namespace
-        assert result.name == config.name
-        assert result.registry == config.registry
-
 
+@pytest.mark.usefixtures("registry_routes")
 class TestProviderInfoErrorHandling:
     """Tests for error scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_read_raises_error_when_config_is_none(self) -> None:
+    async def test_read_raises_error_when_config_is_none(
+        self, provider_info_ds: ProviderInfoDataSource, make_ctx: Callable[[Any], ResourceContext]
+    ) -> None:
         """Test that read raises DataSourceError when config is None."""
-        ds = ProviderInfoDataSource()
-        ctx = ResourceContext(config=None)
-
-        with pytest.raises(DataSourceError, match="Configuration is required"):
-            await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_handles_provider_not_found(self, httpx_mock: HTTPXMock) -> None:
-        """Test that read handles 404 provider not found error."""
-        # Mock a 404 response - registry returns empty dict for 404s
-        httpx_mock.add_response(
-            url="https://registry.terraform.io/v1/providers/nonexistent/provider", status_code=404
-        )
-
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="nonexistent", name="provider", registry="terraform")
-        ctx = ResourceContext(config=config)
+        ctx = make_ctx(None)
 
-        # Should raise DataSourceError with helpful message
-        with pytest.raises(
-            DataSourceError,
-            match="Provider nonexistent/provider not found in terraform registry",
-        ):
-            await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_handles_http_error(self, httpx_mock: HTTPXMock) -> None:
-        """Test that read handles HTTP errors (5xx)."""
-        # Mock a 500 server error - registry returns empty dict for HTTP errors
-        httpx_mock.add_response(
-            url="https://registry.terraform.io/v1/providers/hashicorp/aws", status_code=500
-        )
-
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform")
-        ctx = ResourceContext(config=config)
-
-        # Should raise DataSourceError
-        with pytest.raises(DataSourceError, match="Provider hashicorp/aws not found in terraform registry"):
-            await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_handles_network_error(self, httpx_mock: HTTPXMock) -> None:
-        """Test that read handles network errors."""
-        # Mock a connection error - registry returns empty dict for network errors
-        import httpx
+        with pytest.raises(DataSourceError) as exc_info:
+            await provider_info_ds.read(ctx)
 
-        httpx_mock.add_exception(httpx.ConnectError("Connection failed"))
+        assert str(exc_info.value) == "Configuration is required."
 
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform")
-        ctx = ResourceContext(config=config)
-
-        # Should raise DataSourceError
-        with pytest.raises(DataSourceError, match="Provider hashicorp/aws not found in terraform registry"):
-            await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_wraps_exception_with_context(self, httpx_mock: HTTPXMock) -> None:
-        """Test that exceptions are wrapped with helpful context."""
-        # Mock a 403 error - registry returns empty dict
-        httpx_mock.add_response(
-            url="https://registry.terraform.io/v1/providers/hashicorp/aws", status_code=403
-        )
+    # Registry client returns an empty dict for HTTP errors and network failures alike
+    @pytest.mark.parametrize("name", ["not-found", "forbidden"])
+    async def test_read_registry_failure_raises_not_found(
+        self,
+        provider_info_ds: ProviderInfoDataSource,
+        make_ctx: Callable[[Any], ResourceContext],
+        name: str,
+    ) -> None:
+        """Test that every registry failure surfaces as a DataSourceError naming the provider and registry."""
+        ctx = make_ctx(ProviderInfoConfig(namespace="failing", name=name))
 
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform")
-        ctx = ResourceContext(config=config)
+        with pytest.raises(DataSourceError) as exc_info:
+            await provider_info_ds.read(ctx)
+
+        assert str(exc_info.value) == _not_found_message("failing", name)
+
+    @pytest.mark.parametrize(
+        "stub",
+        [
+            {"return_value": httpx.Response(500, request=_AWS_REQUEST)},
+            {"side_effect": httpx.ConnectError("Connection failed", request=_AWS_REQUEST)},
+        ],
+        ids=["server-error", "unreachable"],
+    )
+    async def test_read_client_failure_raises_not_found(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        provider_info_ds: ProviderInfoDataSource,
+        ctx: ResourceContext,
+        stub: dict[str, Any],
+    ) -> None:
+        """Test that 5xx and network failures surface as "not found", stubbing the client below the transport."""
+        get = AsyncMock(**stub)
+        monkeypatch.setattr(httpx.AsyncClient, "get", get)
 
-        # The error message should include namespace, name, and registry
         with pytest.raises(DataSourceError) as exc_info:
-            await ds.read(ctx)
+            await provider_info_ds.read(ctx)
+
+        assert str(exc_info.value) == _not_found_message(_NAMESPACE, _NAME)
 
-        error_message = str(exc_info.value)
-        assert "hashicorp/aws" in error_message
-        assert "terraform" in error_message
-        assert "not found" in error_message
+        get.assert_awaited_once_with(_AWS_PATH)
 
 
+@pytest.mark.usefixtures("registry_routes")
 class TestProviderInfoEdgeCases:
     """Edge case tests."""
 
-    @pytest.mark.asyncio
     async def test_read_with_null_registry_defaults_to_terraform(
-        self, httpx_mock: HTTPXMock, sample_terraform_response: dict[str, Any]
+        self, provider_info_ds: ProviderInfoDataSource, make_ctx: Callable[[Any], ResourceContext]
     ) -> None:
         """Test that None/null registry value defaults to terraform."""
-        httpx_mock.add_response(
-            url="https://registry.terraform.io/v1/providers/hashicorp/aws", json=sample_terraform_response
-        )
-
-        ds = ProviderInfoDataSource()
         # Explicitly set registry to None
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws", registry=None)
-        ctx = ResourceContext(config=config)
+        ctx = make_ctx(ProviderInfoConfig(namespace=_NAMESPACE, name=_NAME, registry=None))
 
-        result = await ds.read(ctx)
+        result = await provider_info_ds.read(ctx)
 
         # Should use terraform registry (the default)
         assert result.registry is None  # Echoes back the config value
         assert result.latest_version == "5.31.0"  # But successfully fetched from terraform
 
-    @pytest.mark.asyncio
-    async def test_read_response_with_extra_fields_ignored(self, httpx_mock: HTTPXMock) -> None:
+    async def test_read_response_with_extra_fields_ignored(
+        self, provider_info_ds: ProviderInfoDataSource, make_ctx: Callable[[Any], ResourceContext]
+    ) -> None:
         """Test that extra fields in response are safely ignored."""
-        response_with_extras: dict[str, Any] = {
-            "namespace": "hashicorp",
-            "name": "aws",
-            "version": "5.31.0",
-            "description": "AWS Provider",
-            "source": "https://github.com/hashicorp/terraform-provider-aws",
-            "downloads": 1000000,
-            "published_at": "2024-01-15T10:30:00Z",
-            # Extra fields that don't map to our schema
-            "extra_field_1": "ignored",
-            "extra_field_2": 12345,
-            "nested": {"should": "be_ignored"},
-        }
-
-        httpx_mock.add_response(
-            url="https://registry.terraform.io/v1/providers/hashicorp/aws", json=response_with_extras
-        )
-
-        ds = ProviderInfoDataSource()
-        config = ProviderInfoConfig(namespace="hashicorp", name="aws", registry="terraform")
-        ctx = ResourceContext(config=config)
+        ctx = make_ctx(ProviderInfoConfig(namespace=_NAMESPACE, name="extras"))
 
-        result = await ds.read(ctx)
+        result = await provider_info_ds.read(ctx)
 
         # Should successfully extract known fields and ignore extras
         assert result.latest_version == "5.31.0"
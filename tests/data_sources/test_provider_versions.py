@@ -1,14 +1,20 @@
 """Tests for tofusoup_provider_versions data source."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from collections.abc import Callable
+from types import ModuleType
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
 from attrs import evolve
 from pyvider.exceptions import DataSourceError  # type: ignore
 from pyvider.resources.context import ResourceContext  # type: ignore
 from pyvider.schema import PvsSchema  # type: ignore
+from tofusoup.registry.base import BaseTfRegistry  # type: ignore
 from tofusoup.registry.models.provider import ProviderPlatform, ProviderVersion  # type: ignore
 
+from tofusoup.tf.components.data_sources import provider_versions  # type: ignore
 from tofusoup.tf.components.data_sources.provider_versions import (  # type: ignore
     ProviderVersionsConfig,
     ProviderVersionsDataSource,
@@ -16,6 +22,12 @@ from tofusoup.tf.components.data_sources.provider_versions import (  # type: ign
 )
 
 
+@pytest.fixture(scope="session")
+def registry_module() -> ModuleType:
+    """The data source module whose registry clients ``use_registry`` replaces."""
+    return provider_versions
+
+
 @pytest.fixture
 def sample_config() -> ProviderVersionsConfig:
     """Sample valid provider versions config."""
@@ -44,6 +56,10 @@ class TestProviderVersionsDataSource:
         assert "version_count" in schema.block.attributes
         assert "versions" in schema.block.attributes
 
+    def test_get_schema_is_cached(self) -> None:
+        """Test that get_schema returns the same frozen schema on every call."""
+        assert ProviderVersionsDataSource.get_schema() is ProviderVersionsDataSource.get_schema()
+
     def test_schema_has_required_attributes(self) -> None:
         """Test that schema defines all required attributes."""
         schema = ProviderVersionsDataSource.get_schema()
@@ -64,72 +80,89 @@ class TestProviderVersionsDataSource:
         registry_attr = schema.block.attributes["registry"]
         assert registry_attr.default == "terraform"
 
+    def test_config_and_state_are_slotted(self, sample_config: ProviderVersionsConfig) -> None:
+        """Test that config and state instances carry neither a __dict__ nor a weakref slot."""
+        for instance in (sample_config, ProviderVersionsState()):
+            assert not hasattr(instance, "__dict__")
+            assert not hasattr(instance, "__weakref__")
+
+    def test_config_caches_its_hash(self, sample_config: ProviderVersionsConfig) -> None:
+        """Test that the first hash() fills attrs' hash-cache slot, which later calls return."""
+        config = evolve(sample_config)
+        assert config._attrs_cached_hash is None
+
+        first = hash(config)
+
+        assert config._attrs_cached_hash == first
+        assert hash(config) == first
+
 
 class TestProviderVersionsValidation:
     """Tests for configuration validation."""
 
-    @pytest.mark.asyncio
-    async def test_validate_config_valid(self, sample_config: ProviderVersionsConfig) -> None:
-        """Test validation passes for valid config."""
-        ds = ProviderVersionsDataSource()
-        errors = await ds._validate_config(sample_config)
-        assert errors == []
-
-    @pytest.mark.asyncio
-    async def test_validate_config_empty_namespace(self, sample_config: ProviderVersionsConfig) -> None:
-        """Test validation fails for empty namespace."""
-        invalid_config = evolve(sample_config, namespace="")
-        ds = ProviderVersionsDataSource()
-        errors = await ds._validate_config(invalid_config)
-        assert len(errors) == 1
-        assert "'namespace' is required" in errors[0]
-
-    @pytest.mark.asyncio
-    async def test_validate_config_empty_name(self, sample_config: ProviderVersionsConfig) -> None:
-        """Test validation fails for empty name."""
-        invalid_config = evolve(sample_config, name="")
-        ds = ProviderVersionsDataSource()
-        errors = await ds._validate_config(invalid_config)
-        assert len(errors) == 1
-        assert "'name' is required" in errors[0]
-
-    @pytest.mark.asyncio
-    async def test_validate_config_invalid_registry(self, sample_config: ProviderVersionsConfig) -> None:
-        """Test validation fails for invalid registry."""
-        invalid_config = evolve(sample_config, registry="invalid")
-        ds = ProviderVersionsDataSource()
-        errors = await ds._validate_config(invalid_config)
-        assert len(errors) == 1
-        assert "'registry' must be either 'terraform' or 'opentofu'" in errors[0]
-
-    @pytest.mark.asyncio
-    async def test_validate_config_multiple_errors(self) -> None:
-        """Test validation returns multiple errors."""
-        invalid_config = ProviderVersionsConfig(namespace="", name="", registry="bad")
-        ds = ProviderVersionsDataSource()
-        errors = await ds._validate_config(invalid_config)
-        assert len(errors) == 3
+    @pytest.mark.parametrize(
+        ("changes", "expected"),
+        [
+            pytest.param({}, [], id="valid"),
+            pytest.param(
+                {"namespace": ""}, ["'namespace' is required and cannot be empty."], id="empty_namespace"
+            ),
+            pytest.param({"name": ""}, ["'name' is required and cannot be empty."], id="empty_name"),
+            pytest.param(
+                {"registry": "invalid"},
+                ["'registry' must be either 'terraform' or 'opentofu'."],
+                id="invalid_registry",
+            ),
+            pytest.param(
+                {"namespace": "", "name": "", "registry": "bad"},
+                [
+                    "'namespace' is required and cannot be empty.",
+                    "'name' is required and cannot be empty.",
+                    "'registry' must be either 'terraform' or 'opentofu'.",
+                ],
+                id="multiple_errors",
+            ),
+        ],
+    )
+    def test_validate_config_sync(
+        self,
+        sample_config: ProviderVersionsConfig,
+        provider_versions_ds: ProviderVersionsDataSource,
+        changes: dict[str, Any],
+        expected: list[str],
+    ) -> None:
+        """Test the sync core reports the message of every broken rule, in rule order."""
+        assert provider_versions_ds._validate_config_sync(evolve(sample_config, **changes)) == expected
+
+    async def test_validate_config_delegates_to_sync_core(
+        self, sample_config: ProviderVersionsConfig, provider_versions_ds: ProviderVersionsDataSource
+    ) -> None:
+        """Test the async hook awaited by BaseDataSource.validate returns the sync result."""
+        config = evolve(sample_config, namespace="")
+
+        errors = await provider_versions_ds._validate_config(config)
+
+        assert errors == provider_versions_ds._validate_config_sync(config)
 
 
 class TestProviderVersionsRead:
     """Tests for read() method."""
 
-    @pytest.mark.asyncio
     async def test_read_terraform_registry(
-        self, sample_config: ProviderVersionsConfig, sample_provider_versions: list[ProviderVersion]
+        self,
+        sample_config: ProviderVersionsConfig,
+        sample_provider_versions: list[ProviderVersion],
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
     ) -> None:
         """Test reading from Terraform registry."""
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        ctx = make_ctx(sample_config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_provider_versions = AsyncMock(return_value=sample_provider_versions)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        use_registry(fake_registry_class(sample_provider_versions))
 
-        with patch("tofusoup.tf.components.data_sources.provider_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        state = await provider_versions_ds.read(ctx)
 
         assert state.namespace == "hashicorp"
         assert state.name == "aws"
@@ -141,60 +174,59 @@ class TestProviderVersionsRead:
         assert state.versions[0]["protocols"] == ["6"]
         assert len(state.versions[0]["platforms"]) == 2
 
-    @pytest.mark.asyncio
-    async def test_read_opentofu_registry(self, sample_provider_versions: list[ProviderVersion]) -> None:
+    async def test_read_opentofu_registry(
+        self,
+        sample_provider_versions: list[ProviderVersion],
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
         """Test reading from OpenTofu registry."""
         config = ProviderVersionsConfig(namespace="opentofu", name="aws", registry="opentofu")
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=config, state=None)
+        ctx = make_ctx(config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_provider_versions = AsyncMock(return_value=sample_provider_versions)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        use_registry(fake_registry_class(sample_provider_versions), which="opentofu")
 
-        with patch("tofusoup.tf.components.data_sources.provider_versions.OpenTofuRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        state = await provider_versions_ds.read(ctx)
 
         assert state.namespace == "opentofu"
         assert state.registry == "opentofu"
         assert state.version_count == 3
 
-    @pytest.mark.asyncio
-    async def test_read_empty_results(self, sample_config: ProviderVersionsConfig) -> None:
+    async def test_read_empty_results(
+        self,
+        sample_config: ProviderVersionsConfig,
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
         """Test read with no versions found."""
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        ctx = make_ctx(sample_config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_provider_versions = AsyncMock(return_value=[])
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        use_registry(fake_registry_class([]))
 
-        with patch("tofusoup.tf.components.data_sources.provider_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        state = await provider_versions_ds.read(ctx)
 
         assert state.version_count == 0
         assert state.versions == []
 
-    @pytest.mark.asyncio
     async def test_read_version_conversion(
-        self, sample_config: ProviderVersionsConfig, sample_provider_versions: list[ProviderVersion]
+        self,
+        sample_config: ProviderVersionsConfig,
+        sample_provider_versions: list[ProviderVersion],
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
     ) -> None:
         """Test that ProviderVersion objects are correctly converted to dicts."""
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        ctx = make_ctx(sample_config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_provider_versions = AsyncMock(return_value=sample_provider_versions)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        use_registry(fake_registry_class(sample_provider_versions))
 
-        with patch("tofusoup.tf.components.data_sources.provider_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        state = await provider_versions_ds.read(ctx)
 
         # Verify structure
         assert isinstance(state.versions, list)
@@ -207,8 +239,14 @@ class TestProviderVersionsRead:
         assert "os" in version["platforms"][0]
         assert "arch" in version["platforms"][0]
 
-    @pytest.mark.asyncio
-    async def test_read_with_single_version(self, sample_config: ProviderVersionsConfig) -> None:
+    async def test_read_with_single_version(
+        self,
+        sample_config: ProviderVersionsConfig,
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
         """Test read with single version."""
         single_version = [
             ProviderVersion(
@@ -218,149 +256,178 @@ class TestProviderVersionsRead:
             )
         ]
 
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        ctx = make_ctx(sample_config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_provider_versions = AsyncMock(return_value=single_version)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        use_registry(fake_registry_class(single_version))
 
-        with patch("tofusoup.tf.components.data_sources.provider_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        state = await provider_versions_ds.read(ctx)
 
         assert state.version_count == 1
         assert len(state.versions) == 1
         assert state.versions[0]["version"] == "1.0.0"
 
-    @pytest.mark.asyncio
-    async def test_read_passes_provider_id(self, sample_config: ProviderVersionsConfig) -> None:
+    async def test_read_passes_provider_id(
+        self,
+        sample_config: ProviderVersionsConfig,
+        mock_registry_factory: Callable[..., MagicMock],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
         """Test that read passes correct provider_id to registry."""
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        ctx = make_ctx(sample_config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_provider_versions = AsyncMock(return_value=[])
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        registry_mock = mock_registry_factory(list_provider_versions={"return_value": []})
+        use_registry(registry_mock)
 
-        with patch("tofusoup.tf.components.data_sources.provider_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            await ds.read(ctx)
+        await provider_versions_ds.read(ctx)
 
-        mock_registry.list_provider_versions.assert_called_once_with("hashicorp/aws")
+        registry_mock.list_provider_versions.assert_called_once_with("hashicorp/aws")
 
 
 class TestProviderVersionsErrorHandling:
     """Tests for error scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_read_without_config(self) -> None:
+    async def test_read_without_config(
+        self, make_ctx: Callable[[Any], ResourceContext], provider_versions_ds: ProviderVersionsDataSource
+    ) -> None:
         """Test read raises error without config."""
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=None, state=None)
+        ctx = make_ctx(None)
 
         with pytest.raises(DataSourceError, match="Configuration is required"):
-            await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_registry_error(self, sample_config: ProviderVersionsConfig) -> None:
+            await provider_versions_ds.read(ctx)
+
+    async def test_read_registry_error(
+        self,
+        sample_config: ProviderVersionsConfig,
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
         """Test read handles registry errors."""
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        ctx = make_ctx(sample_config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_provider_versions = AsyncMock(side_effect=Exception("Network error"))
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        use_registry(fake_registry_class(error=Exception("Network error")))
 
-        with patch("tofusoup.tf.components.data_sources.provider_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
+        with pytest.raises(DataSourceError, match="Failed to query provider versions"):
+            await provider_versions_ds.read(ctx)
 
-            with pytest.raises(DataSourceError, match="Failed to query provider versions"):
-                await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_opentofu_registry_error(self) -> None:
+    async def test_read_opentofu_registry_error(
+        self,
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
         """Test read handles OpenTofu registry errors."""
         config = ProviderVersionsConfig(namespace="opentofu", name="aws", registry="opentofu")
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=config, state=None)
+        ctx = make_ctx(config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_provider_versions = AsyncMock(side_effect=Exception("API error"))
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        use_registry(fake_registry_class(error=Exception("API error")), which="opentofu")
 
-        with patch("tofusoup.tf.components.data_sources.provider_versions.OpenTofuRegistry") as mock_class:
-            mock_class.return_value = mock_registry
+        with pytest.raises(DataSourceError, match="Failed to query provider versions"):
+            await provider_versions_ds.read(ctx)
 
-            with pytest.raises(DataSourceError, match="Failed to query provider versions"):
-                await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_includes_provider_info_in_error(self, sample_config: ProviderVersionsConfig) -> None:
+    async def test_read_includes_provider_info_in_error(
+        self,
+        sample_config: ProviderVersionsConfig,
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
         """Test error message includes provider namespace/name."""
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        ctx = make_ctx(sample_config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_provider_versions = AsyncMock(side_effect=Exception("Error"))
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        use_registry(fake_registry_class(error=Exception("Error")))
 
-        with patch("tofusoup.tf.components.data_sources.provider_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
+        with pytest.raises(DataSourceError, match="hashicorp/aws"):
+            await provider_versions_ds.read(ctx)
 
-            with pytest.raises(DataSourceError, match="hashicorp/aws"):
-                await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_includes_registry_in_error(self, sample_config: ProviderVersionsConfig) -> None:
+    async def test_read_includes_registry_in_error(
+        self,
+        sample_config: ProviderVersionsConfig,
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
         """Test error message includes registry name."""
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        ctx = make_ctx(sample_config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_provider_versions = AsyncMock(side_effect=Exception("Error"))
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        use_registry(fake_registry_class(error=Exception("Error")))
 
-        with patch("tofusoup.tf.components.data_sources.provider_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-
-            with pytest.raises(DataSourceError, match="terraform registry"):
-                await ds.read(ctx)
+        with pytest.raises(DataSourceError, match="terraform registry"):
+            await provider_versions_ds.read(ctx)
 
 
 class TestProviderVersionsEdgeCases:
     """Edge case tests."""
 
-    @pytest.mark.asyncio
-    async def test_convert_version_with_no_platforms(self, sample_config: ProviderVersionsConfig) -> None:
+    def test_convert_version_with_no_platforms(
+        self, sample_config: ProviderVersionsConfig, provider_versions_ds: ProviderVersionsDataSource
+    ) -> None:
         """Test conversion of version with no platforms."""
         version_no_platforms = ProviderVersion(version="1.0.0", protocols=["6"], platforms=None)
 
-        ds = ProviderVersionsDataSource()
-        result = ds._convert_version_to_dict(version_no_platforms)
+        result = provider_versions_ds._convert_version_to_dict(version_no_platforms)
 
         assert result["platforms"] == []
 
-    @pytest.mark.asyncio
-    async def test_convert_version_with_no_protocols(self, sample_config: ProviderVersionsConfig) -> None:
+    def test_convert_version_with_no_protocols(
+        self, sample_config: ProviderVersionsConfig, provider_versions_ds: ProviderVersionsDataSource
+    ) -> None:
         """Test conversion of version with no protocols."""
         version_no_protocols = ProviderVersion(
             version="1.0.0", protocols=None, platforms=[ProviderPlatform(os="linux", arch="amd64")]
         )
 
-        ds = ProviderVersionsDataSource()
-        result = ds._convert_version_to_dict(version_no_protocols)
+        result = provider_versions_ds._convert_version_to_dict(version_no_protocols)
 
         assert result["protocols"] == []
 
-    @pytest.mark.asyncio
-    async def test_read_with_many_versions(self, sample_config: ProviderVersionsConfig) -> None:
+    def test_convert_version_interns_platform_strings(
+        self, provider_versions_ds: ProviderVersionsDataSource
+    ) -> None:
+        """Equal os/arch strings from separate platforms resolve to one shared string object."""
+        # Build the strings at runtime so they start out as distinct objects, as decoded JSON would
+        linux_a, linux_b = "".join(["lin", "ux"]), "".join(["li", "nux"])
+        assert linux_a is not linux_b
+        version = ProviderVersion(
+            version="1.0.0",
+            protocols=["6"],
+            platforms=[ProviderPlatform(os=linux_a, arch="amd64"), ProviderPlatform(os=linux_b, arch="arm64")],
+        )
+
+        result = provider_versions_ds._convert_version_to_dict(version)
+
+        assert result["platforms"][0]["os"] is result["platforms"][1]["os"]
+
+    def test_convert_version_builds_fresh_platform_dicts(
+        self, provider_versions_ds: ProviderVersionsDataSource
+    ) -> None:
+        """Separate conversions of the same platform get separate dicts, so no state aliases another."""
+        first, second = (
+            provider_versions_ds._convert_version_to_dict(
+                ProviderVersion(
+                    version=v, protocols=["6"], platforms=[ProviderPlatform(os="linux", arch="amd64")]
+                )
+            )
+            for v in ("1.0.0", "2.0.0")
+        )
+
+        assert first["platforms"][0] == second["platforms"][0]
+        assert first["platforms"][0] is not second["platforms"][0]
+
+    async def test_read_with_many_versions(
+        self,
+        sample_config: ProviderVersionsConfig,
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
         """Test read with large number of versions (simulating AWS provider)."""
         # Create 100 versions to simulate real-world scenario
         many_versions = [
@@ -378,23 +445,75 @@ class TestProviderVersionsEdgeCases:
             for i in range(100)
         ]
 
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        ctx = make_ctx(sample_config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_provider_versions = AsyncMock(return_value=many_versions)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        use_registry(fake_registry_class(many_versions))
 
-        with patch("tofusoup.tf.components.data_sources.provider_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        state = await provider_versions_ds.read(ctx)
 
         assert state.version_count == 100
         assert len(state.versions) == 100
-
-    @pytest.mark.asyncio
-    async def test_read_with_many_platforms(self, sample_config: ProviderVersionsConfig) -> None:
+        assert state.versions[0]["platforms"][0] == {"os": "linux", "arch": "amd64"}
+        # Each version gets its own platform dicts: changing one entry leaves the rest alone
+        state.versions[0]["platforms"][0]["arch"] = "changed"
+        assert all(v["platforms"][0] == {"os": "linux", "arch": "amd64"} for v in state.versions[1:])
+
+    async def test_read_converts_each_version_once(
+        self,
+        sample_config: ProviderVersionsConfig,
+        sample_provider_versions: list[ProviderVersion],
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
+        """read() converts every version exactly once."""
+        ctx = make_ctx(sample_config)
+
+        use_registry(fake_registry_class(sample_provider_versions))
+
+        with patch.object(
+            provider_versions_ds,
+            "_convert_version_to_dict",
+            wraps=provider_versions_ds._convert_version_to_dict,
+        ) as convert:
+            await provider_versions_ds.read(ctx)
+
+        assert convert.call_count == len(sample_provider_versions)
+        assert [c.args[0] for c in convert.call_args_list] == sample_provider_versions
+
+    async def test_read_converts_large_responses_in_a_thread(
+        self,
+        sample_config: ProviderVersionsConfig,
+        sample_provider_versions: list[ProviderVersion],
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        monkeypatch: pytest.MonkeyPatch,
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
+        """Responses above the threshold are converted off the event loop with the same result."""
+        monkeypatch.setattr(provider_versions, "_THREAD_CONVERT_THRESHOLD", len(sample_provider_versions) - 1)
+        ctx = make_ctx(sample_config)
+
+        use_registry(fake_registry_class(sample_provider_versions))
+
+        with patch(
+            "tofusoup.tf.components.data_sources.provider_versions.asyncio.to_thread", wraps=asyncio.to_thread
+        ) as to_thread:
+            state = await provider_versions_ds.read(ctx)
+
+        to_thread.assert_awaited_once_with(provider_versions_ds._convert_versions, sample_provider_versions)
+        assert state.versions == provider_versions_ds._convert_versions(sample_provider_versions)
+
+    async def test_read_with_many_platforms(
+        self,
+        sample_config: ProviderVersionsConfig,
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
         """Test read with version having many platforms."""
         version_many_platforms = [
             ProviderVersion(
@@ -413,22 +532,22 @@ class TestProviderVersionsEdgeCases:
             )
         ]
 
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        ctx = make_ctx(sample_config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_provider_versions = AsyncMock(return_value=version_many_platforms)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        use_registry(fake_registry_class(version_many_platforms))
 
-        with patch("tofusoup.tf.components.data_sources.provider_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        state = await provider_versions_ds.read(ctx)
 
         assert len(state.versions[0]["platforms"]) == 8
 
-    @pytest.mark.asyncio
-    async def test_read_with_multiple_protocols(self, sample_config: ProviderVersionsConfig) -> None:
+    async def test_read_with_multiple_protocols(
+        self,
+        sample_config: ProviderVersionsConfig,
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
         """Test read with version supporting multiple protocols."""
         version_multi_protocol = [
             ProviderVersion(
@@ -438,16 +557,89 @@ class TestProviderVersionsEdgeCases:
             )
         ]
 
-        ds = ProviderVersionsDataSource()
-        ctx = ResourceContext(config=sample_config, state=None)
+        ctx = make_ctx(sample_config)
 
-        mock_registry = AsyncMock()
-        mock_registry.list_provider_versions = AsyncMock(return_value=version_multi_protocol)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        use_registry(fake_registry_class(version_multi_protocol))
 
-        with patch("tofusoup.tf.components.data_sources.provider_versions.IBMTerraformRegistry") as mock_class:
-            mock_class.return_value = mock_registry
-            state = await ds.read(ctx)
+        state = await provider_versions_ds.read(ctx)
 
         assert state.versions[0]["protocols"] == ["4.0", "5.0", "6"]
+
+
+class TestProviderVersionsRegistryClient:
+    """Tests for opening and closing registry clients around reads."""
+
+    async def test_each_read_opens_and_closes_its_client(
+        self,
+        sample_config: ProviderVersionsConfig,
+        sample_provider_versions: list[ProviderVersion],
+        mock_registry_factory: Callable[..., MagicMock],
+        use_registry: Callable[..., None],
+        registry_classes: dict[str, MagicMock],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
+        """Every read opens a client and closes it again before returning, so none is left open."""
+        registry_mock = mock_registry_factory(
+            list_provider_versions={"return_value": sample_provider_versions}
+        )
+        use_registry(registry_mock)
+
+        for name in ("aws", "google", "azurerm"):
+            ctx = make_ctx(evolve(sample_config, name=name))
+            state = await provider_versions_ds.read(ctx)
+
+        assert state.version_count == 3
+        assert registry_classes["terraform"].call_count == 3
+        assert registry_mock.__aenter__.await_count == 3
+        assert registry_mock.__aexit__.await_count == 3
+
+    async def test_client_is_closed_when_read_fails(
+        self,
+        sample_config: ProviderVersionsConfig,
+        mock_registry_factory: Callable[..., MagicMock],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
+        """A registry error still closes the client before surfacing as DataSourceError."""
+        ctx = make_ctx(sample_config)
+
+        registry_mock = mock_registry_factory(list_provider_versions={"side_effect": Exception("API error")})
+        use_registry(registry_mock)
+
+        with pytest.raises(DataSourceError):
+            await provider_versions_ds.read(ctx)
+
+        registry_mock.__aexit__.assert_awaited_once()
+
+    async def test_concurrent_reads_of_both_registries(
+        self,
+        sample_config: ProviderVersionsConfig,
+        sample_provider_versions: list[ProviderVersion],
+        fake_registry_class: type[Any],
+        use_registry: Callable[..., None],
+        make_ctx: Callable[[Any], ResourceContext],
+        provider_versions_ds: ProviderVersionsDataSource,
+    ) -> None:
+        """Terraform and OpenTofu reads running together each get their own client and results."""
+        use_registry(fake_registry_class(sample_provider_versions))
+        use_registry(fake_registry_class(sample_provider_versions[:1]), which="opentofu")
+        tofu_config = ProviderVersionsConfig(namespace="opentofu", name="aws", registry="opentofu")
+
+        terraform_state, tofu_state = await asyncio.gather(
+            provider_versions_ds.read(make_ctx(sample_config)),
+            provider_versions_ds.read(make_ctx(tofu_config)),
+        )
+
+        assert (terraform_state.registry, terraform_state.version_count) == ("terraform", 3)
+        assert (tofu_state.registry, tofu_state.version_count) == ("opentofu", 1)
+
+    def test_registry_dispatch_table(self) -> None:
+        """Every valid registry name has a factory building an async-context-manager client."""
+        assert set(provider_versions._REGISTRY_FACTORIES) == provider_versions._REGISTRIES
+        for factory in provider_versions._REGISTRY_FACTORIES.values():
+            client = factory()
+            assert isinstance(client, BaseTfRegistry)
+            assert hasattr(client, "__aenter__")
+            assert hasattr(client, "__aexit__")
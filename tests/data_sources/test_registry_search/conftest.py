@@ -0,0 +1,44 @@
+#
+# SPDX-FileCopyrightText: Copyright (c) 2025 provide.io llc. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+
+"""Shared fixtures for registry_search data source tests."""
+
+from types import ModuleType
+
+import pytest
+from attrs import evolve
+from tofusoup.registry.models.module import Module  # type: ignore
+from tofusoup.registry.models.provider import Provider  # type: ignore
+
+from tofusoup.tf.components.data_sources import registry_search  # type: ignore
+
+
+@pytest.fixture(scope="session")
+def duplicate_search_results(
+    sample_provider_search_results: tuple[Provider, ...], sample_module_search_results: tuple[Module, ...]
+) -> tuple[tuple[Provider, ...], tuple[Module, ...]]:
+    """Provider and module results with repeats, built once per session; tests must treat them as read-only.
+
+    Each list repeats its first record, and one module shares the first provider's namespace and name.
+    """
+    aws = sample_provider_search_results[0]
+    providers = (*sample_provider_search_results, aws)
+    aws_module = evolve(
+        sample_module_search_results[0],
+        id=f"{aws.namespace}/{aws.name}/aws",
+        namespace=aws.namespace,
+        name=aws.name,
+    )
+    modules = (*sample_module_search_results, sample_module_search_results[0], aws_module)
+    return providers, modules
+
+
+@pytest.fixture(scope="session")
+def registry_module() -> ModuleType:
+    """The data source module whose registry clients ``use_registry`` replaces."""
+    return registry_search
+
+
+# 🐍🧪🔚
@@ -27,6 +27,10 @@ class TestRegistrySearchDataSource:
         assert schema.block is not None
         assert schema.block.attributes is not None
 
+    def test_get_schema_is_cached(self):
+        """Test that get_schema returns the same frozen schema on every call."""
+        assert RegistrySearchDataSource.get_schema() is RegistrySearchDataSource.get_schema()
+
     def test_schema_has_required_attributes(self):
         """Test that schema has all required attributes."""
         schema = RegistrySearchDataSource.get_schema()
@@ -69,3 +73,15 @@ class TestRegistrySearchDataSource:
         state = RegistrySearchState(query="aws")
         with pytest.raises(Exception):  # attrs.exceptions.FrozenInstanceError
             state.query = "gcp"  # type: ignore
+
+    def test_config_and_state_are_slotted(self):
+        """Test that config and state instances carry neither a __dict__ nor a weakref slot."""
+        for instance in (RegistrySearchConfig(query="aws"), RegistrySearchState(query="aws")):
+            assert not hasattr(instance, "__dict__")
+            assert not hasattr(instance, "__weakref__")
+
+    def test_config_hash_matches_equal_config(self):
+        """Test that the cached config hash is stable and agrees with equality."""
+        config = RegistrySearchConfig(query="aws")
+        assert hash(config) == hash(config)
+        assert hash(config) == hash(RegistrySearchConfig(query="aws"))
@@ -0,0 +1,19 @@
+"""Micro-benchmarks for the RegistrySearchDataSource result conversion hot path."""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+class TestRegistrySearchConversionBenchmarks:
+    """Per-record cost of converting registry search results to state dicts."""
+
+    def test_convert_provider_benchmark(self, benchmark, sample_provider_search_results, registry_search_ds):
+        """Benchmark _convert_provider_to_dict for a single provider."""
+        result = benchmark(registry_search_ds._convert_provider_to_dict, sample_provider_search_results[0])
+        assert result["type"] == "provider"
+
+    def test_convert_module_benchmark(self, benchmark, sample_module_search_results, registry_search_ds):
+        """Benchmark _convert_module_to_dict for a single module."""
+        result = benchmark(registry_search_ds._convert_module_to_dict, sample_module_search_results[0])
+        assert result["type"] == "module"
@@ -1,249 +1,268 @@
 """Tests for RegistrySearchDataSource edge cases."""
 
-import pytest
+from collections import Counter
+from itertools import cycle, islice
+from unittest.mock import patch
+
+from attrs import evolve
 from pyvider.resources.context import ResourceContext
 
-from tofusoup.tf.components.data_sources.registry_search import (
-    RegistrySearchConfig,
-    RegistrySearchDataSource,
-)
+from tofusoup.tf.components.data_sources.registry_search import RegistrySearchConfig
 
 
 class TestRegistrySearchEdgeCases:
     """Tests for RegistrySearchDataSource edge cases."""
 
-    @pytest.mark.asyncio
-    async def test_result_with_null_description(self, sample_provider_search_results):
+    async def test_result_with_null_description(
+        self, sample_provider_search_results, mock_registry_factory, use_registry, registry_search_ds
+    ):
         """Test handling of null description field."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="test", registry="terraform", resource_type="providers")
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
+        # The sample results are shared across the session, so swap in a copy rather than mutating
+        providers_with_null = [
+            evolve(sample_provider_search_results[0], description=None),
+            *sample_provider_search_results[1:],
+        ]
 
-        # Modify sample to have null description
-        providers_with_null = sample_provider_search_results[:]
-        providers_with_null[0].description = None
+        mock_registry = mock_registry_factory(list_providers={"return_value": providers_with_null})
 
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=providers_with_null)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
 
         assert state.results[0]["description"] is None  # type: ignore
 
-    @pytest.mark.asyncio
-    async def test_result_with_null_source_url(self, sample_module_search_results):
+    async def test_result_with_null_source_url(
+        self, sample_module_search_results, mock_registry_factory, use_registry, registry_search_ds
+    ):
         """Test handling of null source_url field."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="test", registry="terraform", resource_type="modules")
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
+        # The sample results are shared across the session, so swap in a copy rather than mutating
+        modules_with_null = [
+            evolve(sample_module_search_results[0], source_url=None),
+            *sample_module_search_results[1:],
+        ]
 
-        # Modify sample to have null source_url
-        modules_with_null = sample_module_search_results[:]
-        modules_with_null[0].source_url = None
+        mock_registry = mock_registry_factory(list_modules={"return_value": modules_with_null})
 
-        mock_registry = MagicMock()
-        mock_registry.list_modules = AsyncMock(return_value=modules_with_null)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
 
         assert state.results[0]["source_url"] is None  # type: ignore
 
-    @pytest.mark.asyncio
-    async def test_read_with_special_characters_in_query(self, sample_module_search_results):
+    async def test_read_with_special_characters_in_query(
+        self, sample_module_search_results, mock_registry_factory, use_registry, registry_search_ds
+    ):
         """Test handling of special characters in query string."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="test-query_123", registry="terraform")
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=[])
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": []}, list_modules={"return_value": sample_module_search_results}
+        )
 
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
 
         assert state.query == "test-query_123"
 
-    @pytest.mark.asyncio
     async def test_read_with_many_mixed_results(
-        self, sample_provider_search_results, sample_module_search_results
+        self,
+        sample_provider_search_results,
+        sample_module_search_results,
+        mock_registry_factory,
+        use_registry,
+        registry_search_ds,
     ):
         """Test handling of many mixed results."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="aws", registry="terraform", limit=100)
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
+        # Just over the limit in total, cycling the samples with distinct ids so de-duplication keeps them all
+        many_providers = [
+            evolve(p, id=f"{p.id}-{i}")
+            for i, p in enumerate(islice(cycle(sample_provider_search_results), 60))
+        ]
+        many_modules = [
+            evolve(m, id=f"{m.id}-{i}") for i, m in enumerate(islice(cycle(sample_module_search_results), 60))
+        ]
 
-        # Create many results
-        many_providers = sample_provider_search_results * 20
-        many_modules = sample_module_search_results * 30
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": many_providers}, list_modules={"return_value": many_modules}
+        )
 
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=many_providers)
-        mock_registry.list_modules = AsyncMock(return_value=many_modules)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
 
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
-
-        # Limit should be applied
+        # Limit should be applied: all 60 providers first, then the first 40 modules
         assert state.result_count == 100
         assert len(state.results) == 100  # type: ignore
+        assert (state.provider_count, state.module_count) == (60, 40)
 
-    @pytest.mark.asyncio
-    async def test_read_providers_have_type_field(self, sample_provider_search_results):
+    async def test_read_providers_have_type_field(
+        self, sample_provider_search_results, mock_registry_factory, use_registry, registry_search_ds
+    ):
         """Test that provider results have type field set to 'provider'."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="aws", resource_type="providers")
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=sample_provider_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(list_providers={"return_value": sample_provider_search_results})
 
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
 
         for result in state.results:  # type: ignore
             assert result["type"] == "provider"
 
-    @pytest.mark.asyncio
-    async def test_read_modules_have_type_field(self, sample_module_search_results):
+    async def test_read_modules_have_type_field(
+        self, sample_module_search_results, mock_registry_factory, use_registry, registry_search_ds
+    ):
         """Test that module results have type field set to 'module'."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="vpc", resource_type="modules")
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(list_modules={"return_value": sample_module_search_results})
 
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
 
         for result in state.results:  # type: ignore
             assert result["type"] == "module"
 
-    @pytest.mark.asyncio
     async def test_read_limit_applies_after_merge(
-        self, sample_provider_search_results, sample_module_search_results
+        self,
+        sample_provider_search_results,
+        sample_module_search_results,
+        mock_registry_factory,
+        use_registry,
+        registry_search_ds,
     ):
         """Test that limit is applied after merging provider and module results."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="aws", registry="terraform", limit=3)
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=sample_provider_search_results)
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": sample_provider_search_results},
+            list_modules={"return_value": sample_module_search_results},
+        )
 
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        convert_module = registry_search_ds._convert_module_to_dict
+        with patch.object(registry_search_ds, "_convert_module_to_dict", wraps=convert_module) as convert:
+            state = await registry_search_ds.read(ctx)
 
         # Should have exactly 3 results (limit applied after merge)
         assert len(state.results) == 3  # type: ignore
         assert state.result_count == 3
+        # Both providers fill the first two slots; only one module is converted, none past the limit
+        assert convert.call_count == 1
+
+    async def test_read_skips_modules_when_providers_fill_limit(
+        self,
+        sample_provider_search_results,
+        sample_module_search_results,
+        mock_registry_factory,
+        use_registry,
+        registry_search_ds,
+    ):
+        """Test that modules are not fetched at all once providers alone reach the limit."""
+        config = RegistrySearchConfig(
+            query="aws", resource_type="all", limit=len(sample_provider_search_results)
+        )
+        ctx = ResourceContext(config=config, state=None)
+
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": sample_provider_search_results},
+            list_modules={"return_value": sample_module_search_results},
+        )
+
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
+
+        mock_registry.list_providers.assert_awaited_once_with(query="aws")
+        mock_registry.list_modules.assert_not_awaited()
+        assert (state.provider_count, state.module_count) == (len(sample_provider_search_results), 0)
 
-    @pytest.mark.asyncio
     async def test_read_all_includes_both_types(
-        self, sample_provider_search_results, sample_module_search_results
+        self,
+        sample_provider_search_results,
+        sample_module_search_results,
+        mock_registry_factory,
+        use_registry,
+        registry_search_ds,
     ):
         """Test that resource_type='all' includes both providers and modules."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="aws", resource_type="all")
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=sample_provider_search_results)
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
-
-        # Should have both types in results
-        types_found = set(r["type"] for r in state.results)  # type: ignore
-        assert "provider" in types_found
-        assert "module" in types_found
-
-    def test_convert_provider_to_dict(self, sample_provider_search_results):
-        """Test _convert_provider_to_dict method."""
-        ds = RegistrySearchDataSource()
-        provider = sample_provider_search_results[0]
-        result = ds._convert_provider_to_dict(provider)
-
-        assert result["type"] == "provider"
-        assert result["id"] == provider.id
-        assert result["namespace"] == provider.namespace
-        assert result["name"] == provider.name
-        assert result["provider_name"] is None
-        assert result["tier"] == provider.tier
-        assert result["verified"] is None
-
-    def test_convert_module_to_dict(self, sample_module_search_results):
-        """Test _convert_module_to_dict method."""
-        ds = RegistrySearchDataSource()
-        module = sample_module_search_results[0]
-        result = ds._convert_module_to_dict(module)
-
-        assert result["type"] == "module"
-        assert result["id"] == module.id
-        assert result["namespace"] == module.namespace
-        assert result["name"] == module.name
-        assert result["provider_name"] == module.provider_name
-        assert result["downloads"] == module.downloads
-        assert result["verified"] == module.verified
-        assert result["tier"] is None
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": sample_provider_search_results},
+            list_modules={"return_value": sample_module_search_results},
+        )
+
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
+
+        # Should have both types in results, each record exactly once
+        keys = Counter((r["type"], r["namespace"], r["name"]) for r in state.results)  # type: ignore
+        assert {key[0] for key in keys} == {"provider", "module"}
+        assert max(keys.values()) == 1
+
+    async def test_read_drops_duplicate_results(
+        self, duplicate_search_results, mock_registry_factory, use_registry, registry_search_ds
+    ):
+        """Test that repeated registry results are kept once per type and id, in first-seen order."""
+        providers, modules = duplicate_search_results
+        config = RegistrySearchConfig(query="aws", resource_type="all")
+        ctx = ResourceContext(config=config, state=None)
+
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": providers}, list_modules={"return_value": modules}
+        )
+
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
+
+        keys = Counter((r["type"], r["id"]) for r in state.results)  # type: ignore
+        assert max(keys.values()) == 1
+        assert (state.provider_count, state.module_count) == (
+            len({p.id for p in providers}),
+            len({m.id for m in modules}),
+        )
+        # A module sharing a provider's namespace/name is a different record and is kept
+        assert ("module", "hashicorp/aws/aws") in keys
+
+    def test_convert_provider_to_dict(self, sample_provider_search_results, registry_search_ds):
+        """Test _convert_provider_to_dict over every sample provider."""
+        for provider in sample_provider_search_results:
+            assert registry_search_ds._convert_provider_to_dict(provider) == {
+                "type": "provider",
+                "id": provider.id,
+                "namespace": provider.namespace,
+                "name": provider.name,
+                "provider_name": None,
+                "description": provider.description,
+                "source_url": provider.source_url,
+                "downloads": 0,
+                "verified": None,
+                "tier": provider.tier,
+            }
+
+    def test_convert_module_to_dict(self, sample_module_search_results, registry_search_ds):
+        """Test _convert_module_to_dict over every sample module."""
+        for module in sample_module_search_results:
+            assert registry_search_ds._convert_module_to_dict(module) == {
+                "type": "module",
+                "id": module.id,
+                "namespace": module.namespace,
+                "name": module.name,
+                "provider_name": module.provider_name,
+                "description": module.description,
+                "source_url": module.source_url,
+                "downloads": module.downloads,
+                "verified": module.verified,
+                "tier": None,
+            }
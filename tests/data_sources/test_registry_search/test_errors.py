@@ -4,135 +4,62 @@ import pytest
 from pyvider.exceptions import DataSourceError
 from pyvider.resources.context import ResourceContext
 
-from tofusoup.tf.components.data_sources.registry_search import (
-    RegistrySearchConfig,
-    RegistrySearchDataSource,
-)
+from tofusoup.tf.components.data_sources.registry_search import RegistrySearchConfig
 
 
 class TestRegistrySearchErrorHandling:
     """Tests for RegistrySearchDataSource error handling."""
 
-    @pytest.mark.asyncio
-    async def test_read_without_config(self):
+    async def test_read_without_config(self, registry_search_ds):
         """Test that read raises error when config is missing."""
-        ds = RegistrySearchDataSource()
         ctx = ResourceContext(config=None, state=None)
 
         with pytest.raises(DataSourceError, match="Configuration is required"):
-            await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_terraform_registry_error(self):
-        """Test error handling when Terraform registry fails."""
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        ds = RegistrySearchDataSource()
-        config = RegistrySearchConfig(query="aws", registry="terraform")
-        ctx = ResourceContext(config=config, state=None)
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(side_effect=Exception("API error"))
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with (
-            patch(
-                "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-                return_value=mock_registry,
+            await registry_search_ds.read(ctx)
+
+    @pytest.mark.parametrize(
+        ("config", "which", "match"),
+        [
+            pytest.param(
+                RegistrySearchConfig(query="aws", registry="terraform"),
+                "terraform",
+                "Failed to search registry",
+                id="terraform_registry_error",
             ),
-            pytest.raises(DataSourceError, match="Failed to search registry"),
-        ):
-            await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_opentofu_registry_error(self):
-        """Test error handling when OpenTofu registry fails."""
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        ds = RegistrySearchDataSource()
-        config = RegistrySearchConfig(query="aws", registry="opentofu")
-        ctx = ResourceContext(config=config, state=None)
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(side_effect=Exception("API error"))
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with (
-            patch(
-                "tofusoup.tf.components.data_sources.registry_search.OpenTofuRegistry",
-                return_value=mock_registry,
+            pytest.param(
+                RegistrySearchConfig(query="aws", registry="opentofu"),
+                "opentofu",
+                "Failed to search registry",
+                id="opentofu_registry_error",
             ),
-            pytest.raises(DataSourceError, match="Failed to search registry"),
-        ):
-            await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_includes_query_in_error(self):
-        """Test that error message includes query."""
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        ds = RegistrySearchDataSource()
-        config = RegistrySearchConfig(query="myquery", registry="terraform")
-        ctx = ResourceContext(config=config, state=None)
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(side_effect=Exception("API error"))
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with (
-            patch(
-                "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-                return_value=mock_registry,
+            pytest.param(
+                RegistrySearchConfig(query="myquery", registry="terraform"),
+                "terraform",
+                "myquery",
+                id="includes_query",
             ),
-            pytest.raises(DataSourceError, match="myquery"),
-        ):
-            await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_includes_registry_in_error(self):
-        """Test that error message includes registry."""
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        ds = RegistrySearchDataSource()
-        config = RegistrySearchConfig(query="aws", registry="opentofu")
-        ctx = ResourceContext(config=config, state=None)
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(side_effect=Exception("API error"))
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with (
-            patch(
-                "tofusoup.tf.components.data_sources.registry_search.OpenTofuRegistry",
-                return_value=mock_registry,
+            pytest.param(
+                RegistrySearchConfig(query="aws", registry="opentofu"),
+                "opentofu",
+                "opentofu",
+                id="includes_registry",
             ),
-            pytest.raises(DataSourceError, match="opentofu"),
-        ):
-            await ds.read(ctx)
-
-    @pytest.mark.asyncio
-    async def test_read_includes_resource_type_in_error(self):
-        """Test that error message includes resource_type."""
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        ds = RegistrySearchDataSource()
-        config = RegistrySearchConfig(query="aws", resource_type="providers")
+            pytest.param(
+                RegistrySearchConfig(query="aws", resource_type="providers"),
+                "terraform",
+                "providers",
+                id="includes_resource_type",
+            ),
+        ],
+    )
+    async def test_read_registry_error(
+        self, config, which, match, mock_registry_factory, use_registry, registry_search_ds
+    ):
+        """Test that a failing registry surfaces as DataSourceError naming the query, registry and type."""
         ctx = ResourceContext(config=config, state=None)
 
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(side_effect=Exception("API error"))
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(list_providers={"side_effect": Exception("API error")})
 
-        with (
-            patch(
-                "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-                return_value=mock_registry,
-            ),
-            pytest.raises(DataSourceError, match="providers"),
-        ):
-            await ds.read(ctx)
+        use_registry(mock_registry, which=which)
+        with pytest.raises(DataSourceError, match=match):
+            await registry_search_ds.read(ctx)
@@ -3,272 +3,144 @@
 import pytest
 from pyvider.resources.context import ResourceContext
 
-from tofusoup.tf.components.data_sources.registry_search import (
-    RegistrySearchConfig,
-    RegistrySearchDataSource,
-)
+from tofusoup.tf.components.data_sources.registry_search import RegistrySearchConfig
 
 
 class TestRegistrySearchRead:
     """Tests for RegistrySearchDataSource read method."""
 
-    @pytest.mark.asyncio
-    async def test_read_terraform_registry_all_types(
-        self, sample_provider_search_results, sample_module_search_results
+    @pytest.mark.parametrize(
+        ("registry", "resource_type", "expected_counts"),
+        [
+            pytest.param("terraform", "all", (2, 3), id="terraform_all"),
+            pytest.param("terraform", "providers", (2, 0), id="terraform_providers"),
+            pytest.param("terraform", "modules", (0, 3), id="terraform_modules"),
+            pytest.param("opentofu", "all", (2, 3), id="opentofu_all"),
+            pytest.param("opentofu", "providers", (2, 0), id="opentofu_providers"),
+            pytest.param("opentofu", "modules", (0, 3), id="opentofu_modules"),
+        ],
+    )
+    async def test_read_registry_resource_types(
+        self,
+        registry,
+        resource_type,
+        expected_counts,
+        sample_provider_search_results,
+        sample_module_search_results,
+        mock_registry_factory,
+        use_registry,
+        registry_search_ds,
     ):
-        """Test reading from Terraform registry with all resource types."""
-        ds = RegistrySearchDataSource()
-        config = RegistrySearchConfig(query="aws", registry="terraform", resource_type="all", limit=100)
+        """Test reading each registry with each resource_type filter."""
+        config = RegistrySearchConfig(query="aws", registry=registry, resource_type=resource_type, limit=100)
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=sample_provider_search_results)
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
-
-        assert state.query == "aws"
-        assert state.registry == "terraform"
-        assert state.resource_type == "all"
-        assert state.result_count == 5
-        assert state.provider_count == 2
-        assert state.module_count == 3
-        assert len(state.results) == 5  # type: ignore
-        assert state.results[0]["type"] == "provider"  # type: ignore
-        assert state.results[2]["type"] == "module"  # type: ignore
-
-    @pytest.mark.asyncio
-    async def test_read_terraform_registry_providers_only(self, sample_provider_search_results):
-        """Test reading from Terraform registry with providers only."""
-        ds = RegistrySearchDataSource()
-        config = RegistrySearchConfig(query="cloud", registry="terraform", resource_type="providers")
-        ctx = ResourceContext(config=config, state=None)
-
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=sample_provider_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
-
-        assert state.resource_type == "providers"
-        assert state.result_count == 2
-        assert state.provider_count == 2
-        assert state.module_count == 0
-        assert all(r["type"] == "provider" for r in state.results)  # type: ignore
-
-    @pytest.mark.asyncio
-    async def test_read_terraform_registry_modules_only(self, sample_module_search_results):
-        """Test reading from Terraform registry with modules only."""
-        ds = RegistrySearchDataSource()
-        config = RegistrySearchConfig(query="vpc", registry="terraform", resource_type="modules")
-        ctx = ResourceContext(config=config, state=None)
-
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
-
-        assert state.resource_type == "modules"
-        assert state.result_count == 3
-        assert state.provider_count == 0
-        assert state.module_count == 3
-        assert all(r["type"] == "module" for r in state.results)  # type: ignore
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": sample_provider_search_results},
+            list_modules={"return_value": sample_module_search_results},
+        )
 
-    @pytest.mark.asyncio
-    async def test_read_opentofu_registry_all_types(
-        self, sample_provider_search_results, sample_module_search_results
+        use_registry(mock_registry, which=registry)
+        state = await registry_search_ds.read(ctx)
+
+        provider_count, module_count = expected_counts
+        assert (state.query, state.registry, state.resource_type) == ("aws", registry, resource_type)
+        assert (state.provider_count, state.module_count) == expected_counts
+        assert state.result_count == provider_count + module_count
+        # Providers come first, then modules
+        assert [r["type"] for r in state.results] == ["provider"] * provider_count + ["module"] * module_count  # type: ignore
+        # Each requested type is fetched with a single query-only call, never paged by offset
+        if resource_type == "modules":
+            mock_registry.list_providers.assert_not_awaited()
+        else:
+            mock_registry.list_providers.assert_awaited_once_with(query="aws")
+        if resource_type == "providers":
+            mock_registry.list_modules.assert_not_awaited()
+        else:
+            mock_registry.list_modules.assert_awaited_once_with(query="aws")
+
+    async def test_read_default_registry(
+        self,
+        sample_provider_search_results,
+        sample_module_search_results,
+        mock_registry_factory,
+        use_registry,
+        registry_search_ds,
     ):
-        """Test reading from OpenTofu registry with all resource types."""
-        ds = RegistrySearchDataSource()
-        config = RegistrySearchConfig(query="aws", registry="opentofu", resource_type="all")
-        ctx = ResourceContext(config=config, state=None)
-
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=sample_provider_search_results)
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.OpenTofuRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
-
-        assert state.registry == "opentofu"
-        assert state.provider_count == 2
-        assert state.module_count == 3
-
-    @pytest.mark.asyncio
-    async def test_read_opentofu_registry_providers_only(self, sample_provider_search_results):
-        """Test reading from OpenTofu registry with providers only."""
-        ds = RegistrySearchDataSource()
-        config = RegistrySearchConfig(query="cloud", registry="opentofu", resource_type="providers")
-        ctx = ResourceContext(config=config, state=None)
-
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=sample_provider_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.OpenTofuRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
-
-        assert state.resource_type == "providers"
-        assert state.provider_count == 2
-        assert state.module_count == 0
-
-    @pytest.mark.asyncio
-    async def test_read_opentofu_registry_modules_only(self, sample_module_search_results):
-        """Test reading from OpenTofu registry with modules only."""
-        ds = RegistrySearchDataSource()
-        config = RegistrySearchConfig(query="vpc", registry="opentofu", resource_type="modules")
-        ctx = ResourceContext(config=config, state=None)
-
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
-
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.OpenTofuRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
-
-        assert state.resource_type == "modules"
-        assert state.module_count == 3
-
-    @pytest.mark.asyncio
-    async def test_read_default_registry(self, sample_provider_search_results, sample_module_search_results):
         """Test that default registry is terraform."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="aws")  # No registry specified
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=sample_provider_search_results)
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": sample_provider_search_results},
+            list_modules={"return_value": sample_module_search_results},
+        )
 
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
 
         assert state.registry == "terraform"
 
-    @pytest.mark.asyncio
     async def test_read_default_resource_type(
-        self, sample_provider_search_results, sample_module_search_results
+        self,
+        sample_provider_search_results,
+        sample_module_search_results,
+        mock_registry_factory,
+        use_registry,
+        registry_search_ds,
     ):
         """Test that default resource_type is all."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="aws")  # No resource_type specified
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=sample_provider_search_results)
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": sample_provider_search_results},
+            list_modules={"return_value": sample_module_search_results},
+        )
 
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
 
         assert state.resource_type == "all"
         assert state.provider_count > 0
         assert state.module_count > 0
 
-    @pytest.mark.asyncio
-    async def test_read_empty_results(self):
+    async def test_read_empty_results(self, mock_registry_factory, use_registry, registry_search_ds):
         """Test reading when no results are found."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="nonexistent", registry="terraform")
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=[])
-        mock_registry.list_modules = AsyncMock(return_value=[])
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": []}, list_modules={"return_value": []}
+        )
 
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
 
         assert state.result_count == 0
         assert state.provider_count == 0
         assert state.module_count == 0
         assert state.results == []
 
-    @pytest.mark.asyncio
     async def test_read_mixed_results_conversion(
-        self, sample_provider_search_results, sample_module_search_results
+        self,
+        sample_provider_search_results,
+        sample_module_search_results,
+        mock_registry_factory,
+        use_registry,
+        registry_search_ds,
     ):
         """Test that mixed provider and module results are properly converted."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="aws", registry="terraform")
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=sample_provider_search_results)
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": sample_provider_search_results},
+            list_modules={"return_value": sample_module_search_results},
+        )
 
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
 
         # Check provider result has correct fields
         provider_results = [r for r in state.results if r["type"] == "provider"]  # type: ignore
@@ -286,82 +158,73 @@ class TestRegistrySearchRead:
         assert module_results[0]["provider_name"] is not None
         assert module_results[0]["tier"] is None  # N/A for modules
 
-    @pytest.mark.asyncio
-    async def test_read_with_limit_applied(self, sample_provider_search_results, sample_module_search_results):
+    async def test_read_with_limit_applied(
+        self,
+        sample_provider_search_results,
+        sample_module_search_results,
+        mock_registry_factory,
+        use_registry,
+        registry_search_ds,
+    ):
         """Test that limit is properly applied to results."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="aws", registry="terraform", limit=3)
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=sample_provider_search_results)
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": sample_provider_search_results},
+            list_modules={"return_value": sample_module_search_results},
+        )
 
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
 
         assert state.limit == 3
         assert state.result_count == 3
         assert len(state.results) == 3  # type: ignore
 
-    @pytest.mark.asyncio
     async def test_read_preserves_config_values(
-        self, sample_provider_search_results, sample_module_search_results
+        self,
+        sample_provider_search_results,
+        sample_module_search_results,
+        mock_registry_factory,
+        use_registry,
+        registry_search_ds,
     ):
         """Test that config values are preserved in state."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(
             query="kubernetes", registry="opentofu", resource_type="modules", limit=25
         )
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(list_modules={"return_value": sample_module_search_results})
 
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.OpenTofuRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry, which="opentofu")
+        state = await registry_search_ds.read(ctx)
 
         assert state.query == "kubernetes"
         assert state.registry == "opentofu"
         assert state.resource_type == "modules"
         assert state.limit == 25
 
-    @pytest.mark.asyncio
     async def test_read_counts_providers_and_modules(
-        self, sample_provider_search_results, sample_module_search_results
+        self,
+        sample_provider_search_results,
+        sample_module_search_results,
+        mock_registry_factory,
+        use_registry,
+        registry_search_ds,
     ):
         """Test that provider and module counts are accurate."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="aws", registry="terraform")
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=sample_provider_search_results)
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": sample_provider_search_results},
+            list_modules={"return_value": sample_module_search_results},
+        )
 
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
 
         expected_provider_count = len(sample_provider_search_results)
         expected_module_count = len(sample_module_search_results)
@@ -369,26 +232,25 @@ class TestRegistrySearchRead:
         assert state.module_count == expected_module_count
         assert state.result_count == expected_provider_count + expected_module_count
 
-    @pytest.mark.asyncio
-    async def test_read_result_type_field(self, sample_provider_search_results, sample_module_search_results):
+    async def test_read_result_type_field(
+        self,
+        sample_provider_search_results,
+        sample_module_search_results,
+        mock_registry_factory,
+        use_registry,
+        registry_search_ds,
+    ):
         """Test that each result has a type field."""
-        ds = RegistrySearchDataSource()
         config = RegistrySearchConfig(query="aws", registry="terraform")
         ctx = ResourceContext(config=config, state=None)
 
-        from unittest.mock import AsyncMock, MagicMock, patch
-
-        mock_registry = MagicMock()
-        mock_registry.list_providers = AsyncMock(return_value=sample_provider_search_results)
-        mock_registry.list_modules = AsyncMock(return_value=sample_module_search_results)
-        mock_registry.__aenter__ = AsyncMock(return_value=mock_registry)
-        mock_registry.__aexit__ = AsyncMock(return_value=None)
+        mock_registry = mock_registry_factory(
+            list_providers={"return_value": sample_provider_search_results},
+            list_modules={"return_value": sample_module_search_results},
+        )
 
-        with patch(
-            "tofusoup.tf.components.data_sources.registry_search.IBMTerraformRegistry",
-            return_value=mock_registry,
-        ):
-            state = await ds.read(ctx)
+        use_registry(mock_registry)
+        state = await registry_search_ds.read(ctx)
 
         for result in state.results:  # type: ignore
             assert "type" in result
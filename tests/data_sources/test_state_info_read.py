@@ -3,23 +3,19 @@
 import pytest
 from pyvider.resources.context import ResourceContext
 
-from tofusoup.tf.components.data_sources.state_info import (
-    StateInfoConfig,
-    StateInfoDataSource,
-)
+from tofusoup.tf.components.data_sources.state_info import StateInfoConfig
 
 
 class TestStateInfoRead:
     """Tests for StateInfoDataSource read method."""
 
     @pytest.mark.asyncio
-    async def test_read_empty_state(self, sample_empty_state):
+    async def test_read_empty_state(self, sample_empty_state, state_info_ds):
         """Test reading an empty state file."""
-        ds = StateInfoDataSource()
         config = StateInfoConfig(state_path=str(sample_empty_state))
         ctx = ResourceContext(config=config, state=None)
 
-        state = await ds.read(ctx)
+        state = await state_info_ds.read(ctx)
 
         assert state.state_path == str(sample_empty_state)
         assert state.version == 4
@@ -35,13 +31,12 @@ class TestStateInfoRead:
         assert state.state_file_modified is not None
 
     @pytest.mark.asyncio
-    async def test_read_state_with_resources(self, sample_state_with_resources):
+    async def test_read_state_with_resources(self, sample_state_with_resources, state_info_ds):
         """Test reading state file with managed and data resources."""
-        ds = StateInfoDataSource()
         config = StateInfoConfig(state_path=str(sample_state_with_resources))
         ctx = ResourceContext(config=config, state=None)
 
-        state = await ds.read(ctx)
+        state = await state_info_ds.read(ctx)
 
         assert state.version == 4
         assert state.terraform_version == "1.10.2"
@@ -54,13 +49,12 @@ class TestStateInfoRead:
         assert state.modules_count == 0  # No modules in this state
 
     @pytest.mark.asyncio
-    async def test_read_state_with_modules(self, sample_state_with_modules):
+    async def test_read_state_with_modules(self, sample_state_with_modules, state_info_ds):
         """Test reading state file with module resources."""
-        ds = StateInfoDataSource()
         config = StateInfoConfig(state_path=str(sample_state_with_modules))
         ctx = ResourceContext(config=config, state=None)
 
-        state = await ds.read(ctx)
+        state = await state_info_ds.read(ctx)
 
         assert state.version == 4
         assert state.terraform_version == "1.10.0"
@@ -73,24 +67,22 @@ class TestStateInfoRead:
         assert state.modules_count == 2  # ec2_cluster and database
 
     @pytest.mark.asyncio
-    async def test_read_preserves_state_path(self, sample_empty_state):
+    async def test_read_preserves_state_path(self, sample_empty_state, state_info_ds):
         """Test that state_path is echoed back in state."""
-        ds = StateInfoDataSource()
         config = StateInfoConfig(state_path=str(sample_empty_state))
         ctx = ResourceContext(config=config, state=None)
 
-        state = await ds.read(ctx)
+        state = await state_info_ds.read(ctx)
 
         assert state.state_path == str(sample_empty_state)
 
     @pytest.mark.asyncio
-    async def test_read_file_metadata(self, sample_empty_state):
+    async def test_read_file_metadata(self, sample_empty_state, state_info_ds):
         """Test that file metadata is populated."""
-        ds = StateInfoDataSource()
         config = StateInfoConfig(state_path=str(sample_empty_state))
         ctx = ResourceContext(config=config, state=None)
 
-        state = await ds.read(ctx)
+        state = await state_info_ds.read(ctx)
 
         # File size should be > 0
         assert state.state_file_size is not None
@@ -101,13 +93,12 @@ class TestStateInfoRead:
         assert "T" in state.state_file_modified  # ISO 8601 format
 
     @pytest.mark.asyncio
-    async def test_read_counts_managed_vs_data(self, sample_state_with_resources):
+    async def test_read_counts_managed_vs_data(self, sample_state_with_resources, state_info_ds):
         """Test that managed and data resources are counted correctly."""
-        ds = StateInfoDataSource()
         config = StateInfoConfig(state_path=str(sample_state_with_resources))
         ctx = ResourceContext(config=config, state=None)
 
-        state = await ds.read(ctx)
+        state = await state_info_ds.read(ctx)
 
         # Verify counts add up
         assert state.resources_count == state.managed_resources_count + state.data_resources_count
@@ -115,45 +106,42 @@ class TestStateInfoRead:
         assert state.data_resources_count == 1
 
     @pytest.mark.asyncio
-    async def test_read_counts_unique_modules(self, sample_state_with_modules):
+    async def test_read_counts_unique_modules(self, sample_state_with_modules, state_info_ds):
         """Test that unique modules are counted correctly."""
-        ds = StateInfoDataSource()
         config = StateInfoConfig(state_path=str(sample_state_with_modules))
         ctx = ResourceContext(config=config, state=None)
 
-        state = await ds.read(ctx)
+        state = await state_info_ds.read(ctx)
 
         # Should count 2 unique modules (ec2_cluster and database)
         assert state.modules_count == 2
 
     @pytest.mark.asyncio
-    async def test_read_counts_outputs(self, sample_state_with_resources):
+    async def test_read_counts_outputs(self, sample_state_with_resources, state_info_ds):
         """Test that outputs are counted correctly."""
-        ds = StateInfoDataSource()
         config = StateInfoConfig(state_path=str(sample_state_with_resources))
         ctx = ResourceContext(config=config, state=None)
 
-        state = await ds.read(ctx)
+        state = await state_info_ds.read(ctx)
 
         assert state.outputs_count == 3
 
     @pytest.mark.asyncio
-    async def test_read_with_relative_path(self, sample_empty_state, monkeypatch):
+    async def test_read_with_relative_path(self, sample_empty_state, monkeypatch, state_info_ds):
         """Test reading state with relative path."""
         # Change to the directory containing the state file
         monkeypatch.chdir(sample_empty_state.parent)
 
-        ds = StateInfoDataSource()
         config = StateInfoConfig(state_path=sample_empty_state.name)
         ctx = ResourceContext(config=config, state=None)
 
-        state = await ds.read(ctx)
+        state = await state_info_ds.read(ctx)
 
         assert state.version == 4
         assert state.resources_count == 0
 
     @pytest.mark.asyncio
-    async def test_read_with_home_expansion(self, sample_empty_state, tmp_path, monkeypatch):
+    async def test_read_with_home_expansion(self, sample_empty_state, tmp_path, monkeypatch, state_info_ds):
         """Test reading state with ~ expansion."""
         # Create state file in a test "home" directory
         test_home = tmp_path / "home"
@@ -164,10 +152,9 @@ class TestStateInfoRead:
         # Mock home directory
         monkeypatch.setenv("HOME", str(test_home))
 
-        ds = StateInfoDataSource()
         config = StateInfoConfig(state_path="~/terraform.tfstate")
         ctx = ResourceContext(config=config, state=None)
 
-        state = await ds.read(ctx)
+        state = await state_info_ds.read(ctx)
 
         assert state.version == 4
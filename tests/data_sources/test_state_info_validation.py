@@ -2,28 +2,23 @@
 
 import pytest
 
-from tofusoup.tf.components.data_sources.state_info import (
-    StateInfoConfig,
-    StateInfoDataSource,
-)
+from tofusoup.tf.components.data_sources.state_info import StateInfoConfig
 
 
 class TestStateInfoValidation:
     """Tests for StateInfoDataSource configuration validation."""
 
     @pytest.mark.asyncio
-    async def test_validate_config_valid(self):
+    async def test_validate_config_valid(self, state_info_ds):
         """Test validation with valid configuration."""
-        ds = StateInfoDataSource()
         config = StateInfoConfig(state_path="/path/to/terraform.tfstate")
-        errors = await ds._validate_config(config)
+        errors = await state_info_ds._validate_config(config)
         assert errors == []
 
     @pytest.mark.asyncio
-    async def test_validate_config_empty_state_path(self):
+    async def test_validate_config_empty_state_path(self, state_info_ds):
         """Test validation with empty state_path."""
-        ds = StateInfoDataSource()
         config = StateInfoConfig(state_path="")
-        errors = await ds._validate_config(config)
+        errors = await state_info_ds._validate_config(config)
         assert len(errors) == 1
         assert "state_path" in errors[0].lower()
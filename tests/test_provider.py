@@ -1,6 +1,7 @@
 """Tests for TofuSoup provider."""
 
 import pytest
+from attrs.exceptions import FrozenInstanceError
 
 from tofusoup.tf.components.provider import (  # type: ignore[import-untyped]
     TofuSoupProvider,
@@ -59,8 +60,6 @@ def test_provider_schema() -> None:
 
 def test_provider_config_immutable() -> None:
     """Test that provider config is immutable (frozen)."""
-    from attrs.exceptions import FrozenInstanceError
-
     config = TofuSoupProviderConfig(cache_dir="/test")
     with pytest.raises(FrozenInstanceError):
         config.cache_dir = "/new"